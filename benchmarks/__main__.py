@@ -0,0 +1,63 @@
+import argparse
+import json
+import sys
+
+from .runner import run, compare
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="dictparser mapper benchmarks")
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and print the results as JSON")
+    run_parser.add_argument("--width", type=int, default=10, help="number of fields of the generated classes, except polymorphic")
+    run_parser.add_argument("--depth", type=int, default=3, help="nesting depth of nested and tree workloads")
+    run_parser.add_argument("--size", type=int, default=10, help="size of the generated lists and dicts")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds spent on each measurement")
+    run_parser.add_argument("--workload", action="append", help="only run the given workloads")
+    run_parser.add_argument("--compiled", action="store_true", help="use Mapper(compiled=True)")
+    run_parser.add_argument("--output", help="write the results to this file instead of stdout")
+
+    compare_parser = subparsers.add_parser("compare", help="compare the ops/sec of two result files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("other")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.base, "rt", encoding="utf-8") as f:
+            base = json.load(f)
+
+        with open(args.other, "rt", encoding="utf-8") as f:
+            other = json.load(f)
+
+        for workload, operation, ratio in compare(base, other):
+            print(f"{workload:<12} {operation:<16} {ratio:6.2f}x")
+
+        return 0
+
+    if args.command is None:
+        args = run_parser.parse_args([])
+
+    mapper_options = {}
+    if args.compiled:
+        mapper_options["compiled"] = True
+
+    results = run(
+        width=args.width, depth=args.depth, size=args.size, seed=args.seed, min_time=args.min_time,
+        workloads=args.workload, mapper_options=mapper_options
+    )
+
+    if args.output:
+        with open(args.output, "wt", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
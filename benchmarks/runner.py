@@ -0,0 +1,110 @@
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing
+
+if typing.TYPE_CHECKING:
+    from dictparser.mapper import Mapper
+
+    from .workloads import Workload
+
+
+def measure(func: typing.Callable[[], typing.Any], objects: int, min_time: float) -> dict:
+    func()
+
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+
+    while elapsed < min_time:
+        func()
+        count += 1
+        elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops_per_sec": count / elapsed,
+        "objects_per_sec": count * objects / elapsed,
+        "latency_per_op_us": elapsed / count * 1e6,
+        "latency_per_object_us": elapsed / (count * objects) * 1e6,
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_workload(mapper: 'Mapper', workload: 'Workload', tmp_dir: str, min_time: float) -> dict:
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    instance = mapper.from_dict(workload.cls, workload.payload)
+    assert mapper.from_dict(workload.cls, mapper.to_dict(instance)) == instance
+
+    yaml_path = os.path.join(tmp_dir, f"{workload.name}.yaml")
+    with open(yaml_path, "wt", encoding="utf-8") as f:
+        yaml.safe_dump(workload.payload, f)
+
+    json_path = os.path.join(tmp_dir, f"{workload.name}.json")
+    with open(json_path, "wt", encoding="utf-8") as f:
+        json.dump(workload.payload, f)
+
+    return {
+        "objects": workload.objects,
+        "decode": measure(lambda: mapper.from_dict(workload.cls, workload.payload), workload.objects, min_time),
+        "encode": measure(lambda: mapper.to_dict(instance), workload.objects, min_time),
+        "from_file_yaml": measure(lambda: mapper.from_file(workload.cls, yaml_path), workload.objects, min_time),
+        "from_file_json": measure(lambda: mapper.from_file(workload.cls, json_path), workload.objects, min_time),
+    }
+
+
+def run(
+    width: int = 10, depth: int = 3, size: int = 10, seed: int = 0, min_time: float = 0.2,
+    workloads: typing.Optional[typing.Collection[str]] = None, mapper_options: typing.Optional[dict] = None
+) -> dict:  # pylint: disable=too-many-arguments
+    # Imported here so that compare works without dictparser being importable
+    from dictparser.mapper import Mapper  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    from .workloads import make_workloads  # pylint: disable=import-outside-toplevel
+
+    mapper_options = mapper_options or {}
+    mapper = Mapper(**mapper_options)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for workload in make_workloads(width, depth, size, seed):
+            if workloads and workload.name not in workloads:
+                continue
+
+            results[workload.name] = run_workload(mapper, workload, tmp_dir, min_time)
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "parameters": {"width": width, "depth": depth, "size": size, "seed": seed, "min_time": min_time},
+        "mapper_options": mapper_options,
+        "results": results,
+    }
+
+
+def compare(base: dict, other: dict) -> typing.List[typing.Tuple[str, str, float]]:
+    """Returns the ops/sec ratio of other versus base for every workload and operation present in both runs"""
+    res = []
+
+    for workload, operations in base["results"].items():
+        for operation, stats in operations.items():
+            if not isinstance(stats, dict):
+                continue
+
+            other_stats = other["results"].get(workload, {}).get(operation)
+            if other_stats is not None:
+                res.append((workload, operation, other_stats["ops_per_sec"] / stats["ops_per_sec"]))
+
+    return res
@@ -0,0 +1,146 @@
+import random
+import typing
+
+from typing import Optional, List, Dict
+
+from dictparser import dictparser, type_info
+
+
+_PRIMITIVES = (int, float, str, bool)
+
+
+class Workload:  # pylint: disable=too-few-public-methods
+    def __init__(self, name: str, cls: typing.Type, payload: dict, objects: int):
+        self.name = name
+        self.cls = cls
+        self.payload = payload
+        self.objects = objects
+
+
+@dictparser(kw_only=True)
+class Tree:
+    name: str
+    value: int = 0
+    children: List['Tree'] = []
+
+
+@type_info(data_key="kind")
+@dictparser()
+class Event:
+    id: int = 0
+
+
+@dictparser()
+class EventBatch:
+    events: List[Event]
+
+
+_EVENT_SUBTYPES = 8
+_EVENT_WIDTH = 10
+
+
+def _primitive_value(rnd: random.Random, vtype):
+    if vtype is int:
+        return rnd.randint(0, 1 << 30)
+    elif vtype is float:
+        return rnd.random()
+    elif vtype is str:
+        return f"value-{rnd.randint(0, 1000)}"
+    else:
+        return rnd.random() < 0.5
+
+
+def _make_class(name: str, annotations: dict, defaults: typing.Optional[dict] = None, bases=(), **kargs):
+    namespace = {"__annotations__": annotations, "__module__": __name__, "__qualname__": name}
+    namespace.update(defaults or {})
+    return dictparser(**kargs)(type(name, bases, namespace))
+
+
+def make_flat(rnd: random.Random, width: int) -> Workload:
+    annotations = {f"f{i}": _PRIMITIVES[i % len(_PRIMITIVES)] for i in range(width)}
+    cls = _make_class(f"Flat{width}", annotations)
+    payload = {name: _primitive_value(rnd, vtype) for name, vtype in annotations.items()}
+    return Workload("flat", cls, payload, 1)
+
+
+def make_optional(rnd: random.Random, width: int) -> Workload:
+    annotations = {f"f{i}": Optional[_PRIMITIVES[i % len(_PRIMITIVES)]] for i in range(width)}
+    defaults = {name: None for name in annotations}
+    cls = _make_class(f"Optional{width}", annotations, defaults)
+    payload = {
+        name: _primitive_value(rnd, typing.get_args(vtype)[0])
+        for i, (name, vtype) in enumerate(annotations.items())
+        if i % 2 == 0
+    }
+    return Workload("optional", cls, payload, 1)
+
+
+def make_nested(rnd: random.Random, width: int, depth: int, size: int) -> Workload:
+    leaf = make_flat(rnd, width)
+
+    cls = leaf.cls
+    payload = leaf.payload
+    objects = 1
+
+    for level in range(depth):
+        cls = _make_class(f"Nested{level}", {
+            "items": List[cls],
+            "by_key": Dict[str, cls],
+            "numbers": List[float],
+            "child": Optional[cls],
+        }, {"child": None})
+
+        payload = {
+            "items": [payload] * size,
+            "by_key": {f"k{i}": payload for i in range(size)},
+            "numbers": [rnd.random() for _ in range(size)],
+            "child": payload,
+        }
+        objects = 1 + objects * (2 * size + 1)
+
+    return Workload("nested", cls, payload, objects)
+
+
+def make_tree(rnd: random.Random, depth: int, size: int) -> Workload:
+    def make_node(level):
+        node = {"name": f"node-{level}", "value": rnd.randint(0, 100)}
+        if level < depth:
+            node["children"] = [make_node(level + 1) for _ in range(size)]
+        return node
+
+    objects = sum(size ** level for level in range(depth + 1))
+    return Workload("tree", Tree, make_node(0), objects)
+
+
+def _make_event_class(i: int):
+    annotations = {f"s{i}_{j}": _PRIMITIVES[j % len(_PRIMITIVES)] for j in range(_EVENT_WIDTH)}
+    defaults = {name: vtype() for name, vtype in annotations.items()}
+    return type_info(name=f"Event{i}")(_make_class(f"Event{i}", annotations, defaults, bases=(Event,)))
+
+
+# Declared once, as declaring them again would replace the registered type_info subclasses on every call
+_EVENT_CLASSES = [_make_event_class(i) for i in range(_EVENT_SUBTYPES)]
+
+
+def make_polymorphic(rnd: random.Random, size: int) -> Workload:
+    events = []
+    for i in range(size):
+        cls = _EVENT_CLASSES[i % _EVENT_SUBTYPES]
+        annotations = cls.__annotations__
+        event = {"kind": cls.__name__, "id": i}
+        event.update({field: _primitive_value(rnd, vtype) for field, vtype in annotations.items()})
+        events.append(event)
+
+    return Workload("polymorphic", EventBatch, {"events": events}, size + 1)
+
+
+def make_workloads(width: int = 10, depth: int = 3, size: int = 10, seed: int = 0) -> typing.List[Workload]:
+    rnd = random.Random(seed)
+
+    return [
+        make_flat(rnd, width),
+        make_optional(rnd, width),
+        make_nested(rnd, width, depth, size),
+        make_tree(rnd, depth, size),
+        make_polymorphic(rnd, size),
+    ]
@@ -1,22 +1,46 @@
-__all__ = ['from_dict', 'from_file', 'to_dict', 'as_dict', 'fields', 'Field', 'dictparser', 'type_info']
+__all__ = [
+    'from_dict', 'from_dicts', 'from_file', 'iter_file', 'from_files', 'from_file_async', 'iter_file_async', 'prepare',
+    'redecode', 'to_dict', 'as_dict', 'fields', 'Field', 'FilesLoadError', 'Projection', 'SKIPPED', 'dictparser',
+    'type_info'
+]
 
 import sys
 
 if sys.version_info >= (3, 11):
     from ._init_p311 import from_dict
+    from ._init_p311 import from_dicts
     from ._init_p311 import from_file
+    from ._init_p311 import iter_file
+    from ._init_p311 import from_files
+    from ._init_p311 import from_file_async
+    from ._init_p311 import iter_file_async
+    from ._init_p311 import prepare
+    from ._init_p311 import redecode
     from ._init_p311 import to_dict
     from ._init_p311 import as_dict
     from ._init_p311 import fields
     from ._init_p311 import Field
+    from ._init_p311 import FilesLoadError
+    from ._init_p311 import Projection
+    from ._init_p311 import SKIPPED
     from ._init_p311 import dictparser
     from ._init_p311 import type_info
 else:
     from ._init_p36 import from_dict
+    from ._init_p36 import from_dicts
     from ._init_p36 import from_file
+    from ._init_p36 import iter_file
+    from ._init_p36 import from_files
+    from ._init_p36 import from_file_async
+    from ._init_p36 import iter_file_async
+    from ._init_p36 import prepare
+    from ._init_p36 import redecode
     from ._init_p36 import to_dict
     from ._init_p36 import as_dict
     from ._init_p36 import fields
     from ._init_p36 import Field
+    from ._init_p36 import FilesLoadError
+    from ._init_p36 import Projection
+    from ._init_p36 import SKIPPED
     from ._init_p36 import dictparser
     from ._init_p36 import type_info
@@ -0,0 +1,46 @@
+import sys
+import typing
+
+from ._dictparser_data import MISSING
+
+# asyncio is imported on first use, it is the slowest module to import among the ones used here
+# pylint: disable=import-outside-toplevel
+
+
+def _get_running_loop():
+    import asyncio
+
+    if sys.version_info >= (3, 7):
+        return asyncio.get_running_loop()
+    else:
+        return asyncio.get_event_loop()
+
+
+async def from_file_async(mapper, cls, file, format, executor):  # pylint: disable=redefined-builtin
+    return await _get_running_loop().run_in_executor(executor, mapper.from_file, cls, file, format)
+
+
+async def iter_file_async(mapper, cls, file, format, executor) -> typing.AsyncIterator:  # pylint: disable=redefined-builtin
+    import asyncio
+
+    loop = _get_running_loop()
+    documents = mapper.iter_file(cls, file, format)
+    pending = None
+
+    try:
+        while True:
+            # Shielded so that a cancellation never leaves the generator running in the executor unnoticed
+            pending = loop.run_in_executor(executor, next, documents, MISSING)
+            value = await asyncio.shield(pending)
+            pending = None
+
+            if value is MISSING:
+                return
+
+            yield value
+    finally:
+        if pending is not None:
+            # A generator can not be closed while it is still reading the current document
+            await asyncio.wait([pending])
+
+        await loop.run_in_executor(executor, documents.close)
@@ -0,0 +1,148 @@
+import collections
+import itertools
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+
+
+def iter_chunks(records: typing.Iterable, chunk_size: int) -> typing.Iterator[list]:
+    iterator = iter(records)
+
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def decode_records(mapper, cls, records: list) -> list:
+    decode = mapper.get_converter_for_type(cls).get_from_dict()
+    return [decode(data) for data in records]
+
+
+# Mappers received by this process, by SharedMapper token. Only the most recent ones are kept
+_shared_mappers: 'collections.OrderedDict[tuple, SharedMapper]' = collections.OrderedDict()
+_shared_mappers_size = 8
+_shared_tokens = itertools.count()
+
+
+class SharedMapper:
+    """Sends a mapper to worker processes once per process instead of once per task
+
+    Every task still pickles the mapper, but each process keeps the first copy it receives: its converters and
+    decoders are built there once, for every chunk of the call.
+    """
+    __slots__ = ("token", "mapper")
+
+    def __init__(self, mapper, token=None):
+        self.token = (os.getpid(), next(_shared_tokens)) if token is None else token
+        self.mapper = mapper
+
+    def __reduce__(self):
+        return (_get_shared_mapper, (self.token, self.mapper))
+
+
+def _get_shared_mapper(token, mapper) -> SharedMapper:
+    shared = _shared_mappers.get(token, None)
+
+    if shared is None:
+        shared = _shared_mappers[token] = SharedMapper(mapper, token)
+
+        while len(_shared_mappers) > _shared_mappers_size:
+            _shared_mappers.popitem(last=False)
+
+    return shared
+
+
+def decode_records_shared(shared: SharedMapper, cls, records: list) -> list:
+    return decode_records(shared.mapper, cls, records)
+
+
+class FilesLoadError(RuntimeError):
+    """Raised by from_files when some of the files could not be loaded
+
+    errors holds a (path, exception) pair for every failed file, in input order.
+    """
+
+    def __init__(self, errors: typing.List[typing.Tuple[typing.Any, BaseException]]):
+        super().__init__(
+            f"Failed to load {len(errors)} file(s): " + ", ".join(f"'{path}': {error}" for path, error in errors)
+        )
+        self.errors = errors
+
+
+def load_files(mapper, cls, paths: list) -> list:
+    """Loads every path, returns (True, value) or (False, exception) for each of them"""
+    res = []
+
+    for path in paths:
+        try:
+            res.append((True, mapper.from_file(cls, path)))
+        except Exception as e:  # pylint: disable=broad-except
+            res.append((False, e))
+
+    return res
+
+
+def load_files_shared(shared: SharedMapper, cls, paths: list) -> list:
+    return load_files(shared.mapper, cls, paths)
+
+
+def collect_files(paths: list, outcomes: typing.Iterable, return_exceptions: bool) -> list:
+    res = []
+    errors = []
+
+    for path, (ok, value) in zip(paths, outcomes):
+        if not ok:
+            errors.append((path, value))
+
+        res.append(value)
+
+    if errors and not return_exceptions:
+        raise FilesLoadError(errors) from errors[0][1]
+
+    return res
+
+
+def make_executor(executor, workers: int) -> 'concurrent.futures.Executor':
+    import concurrent.futures  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    if executor == "thread":
+        return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    elif executor == "process":
+        return concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    else:
+        raise RuntimeError(f"Unknown executor '{executor}'")
+
+
+def iter_parallel(
+    executor, workers: int, func: typing.Callable, items: typing.Iterable
+) -> typing.Iterator:
+    """Runs func over items in an executor, keeping at most 2 * workers calls in flight, and yields results in order"""
+    if not isinstance(executor, str):
+        pool = executor
+        owns_pool = False
+    else:
+        pool = make_executor(executor, workers)
+        owns_pool = True
+
+    pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+
+    try:
+        for item in items:
+            pending.append(pool.submit(func, item))
+
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        if owns_pool:
+            pool.shutdown(wait=True)
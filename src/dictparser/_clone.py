@@ -0,0 +1,118 @@
+import copy
+import sys
+import typing
+
+from ._dictparser_data import CLASS_DATA_FIELD_NAME
+from ._type_utils import type_get_origin, type_get_args, is_union_type
+from ._codegen import make_class_cloner
+
+
+_IMMUTABLE_TYPES = frozenset((bool, int, float, complex, str, bytes, type(None)))
+
+
+def is_immutable_type(vtype, _visiting: typing.Optional[set] = None) -> bool:
+    """True when values of the declared type can be shared between instances"""
+    if vtype in _IMMUTABLE_TYPES or vtype is None:
+        return True
+
+    pathlib = sys.modules.get("pathlib", None)
+    if pathlib is not None and isinstance(vtype, type) and issubclass(vtype, pathlib.PurePath):
+        return True
+
+    datetime = sys.modules.get("datetime", None)
+    if datetime is not None and vtype in (datetime.datetime, datetime.date, datetime.time, datetime.timedelta):
+        return True
+
+    if is_union_type(vtype):
+        return all(is_immutable_type(arg, _visiting) for arg in type_get_args(vtype))
+
+    if hasattr(vtype, CLASS_DATA_FIELD_NAME) and isinstance(vtype, type):
+        params = getattr(vtype, "__dataclass_params__", None)
+        if params is None or not params.frozen:
+            return False
+
+        # A frozen class is only immutable when its fields are. Self references are assumed immutable, any other
+        # field decides. Type hints are used directly, the class may be the one being resolved
+        _visiting = set() if _visiting is None else _visiting
+        if vtype in _visiting:
+            return True
+
+        _visiting.add(vtype)
+        return all(is_immutable_type(t, _visiting) for t in typing.get_type_hints(vtype).values())
+
+    return False
+
+
+def make_cloner(vtype) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+    """Returns a function that copies values of the declared type, or None when they can be shared"""
+    if is_immutable_type(vtype):
+        return None
+
+    if is_union_type(vtype):
+        args = [arg for arg in type_get_args(vtype) if arg is not type(None) and arg is not None]
+
+        if len(args) == 1:
+            item_cloner = make_cloner(args[0])
+
+            def clone_optional(value):
+                return None if value is None else item_cloner(value)
+
+            return clone_optional
+
+    elif type_get_origin(vtype) in (list, typing.List):
+        item_cloner = make_cloner(type_get_args(vtype)[0])
+        if item_cloner is None:
+            return list
+
+        def clone_list(value):
+            return [item_cloner(v) for v in value]
+
+        return clone_list
+
+    elif type_get_origin(vtype) in (dict, typing.Dict):
+        # Keys are hashable, they are always shared
+        value_cloner = make_cloner(type_get_args(vtype)[1])
+        if value_cloner is None:
+            return dict
+
+        def clone_dict(value):
+            return {k: value_cloner(v) for k, v in value.items()}
+
+        return clone_dict
+
+    elif hasattr(vtype, CLASS_DATA_FIELD_NAME):
+        return clone_dictparser
+
+    return copy.deepcopy
+
+
+def clone_dictparser(value):
+    # Looked up by the class of the value and not the declared one, a default can hold a subclass of it
+    cls = value.__class__
+    class_data = getattr(cls, CLASS_DATA_FIELD_NAME, None)
+    if class_data is None or class_data.result_cls is not cls:
+        return copy.deepcopy(value)
+
+    cloner = class_data.cloner
+    if cloner is None:
+        cloner = class_data.cloner = _make_dictparser_cloner(cls, class_data)
+
+    return cloner(value)
+
+
+def _make_dictparser_cloner(cls, class_data) -> typing.Callable[[typing.Any], typing.Any]:
+    # The cloner builds the copy with the constructor. A __post_init__ would run again on the copy, deepcopy
+    # restores the state as it is instead
+    if hasattr(cls, "__post_init__"):
+        return copy.deepcopy
+
+    # Only when the constructor takes exactly the dictparser fields
+    field_table = class_data.resolved_data.field_table
+    dataclass_fields = getattr(cls, "__dataclass_fields__", {})
+    if set(dataclass_fields) != {field.field_name for field in field_table}:
+        return copy.deepcopy
+
+    if any(not f.init for f in dataclass_fields.values()):
+        return copy.deepcopy
+
+    return make_class_cloner(cls, [(field.field_name, make_cloner(field.field_type)) for field in field_table])
@@ -0,0 +1,248 @@
+import typing
+
+from ._dictparser_data import SKIPPED, ClassData
+from ._lazy import get_field_lazy_factory
+
+
+_INLINE_TYPES = (bool, int, float, complex, str, bytes, bytearray)
+
+
+class _Missing:  # pylint: disable=too-few-public-methods
+    pass
+
+
+def make_class_decoder(
+    mapper, class_data: ClassData, discriminator: typing.Optional[str] = None, projection=None
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """Generates a function with the same behavior as the DictparserConverter field loop for one class
+
+    With a projection, only the selected fields are read from data. The others take their default value, or SKIPPED
+    when they are required, and extra keys are not reported.
+    """
+    resolved_data = class_data.resolved_data
+    cls = class_data.result_cls
+
+    namespace: typing.Dict[str, typing.Any] = {
+        "cls": cls,
+        "missing": _Missing,
+        "skipped": SKIPPED,
+        "isinstance": isinstance,
+        "len": len,
+        "RuntimeError": RuntimeError,
+    }
+
+    lines = [
+        "def decode(data):",
+        "    data_get = data.get",
+        "    found = 0",
+    ]
+    args = []
+    known_keys = []
+
+    for i, field in enumerate(resolved_data.field_table):
+        value = f"value_{i}"
+        args.append(f"{field.field_name}={value}")
+
+        if projection is not None and field.field_name not in projection.fields:
+            if field.has_default and field.default_factory:
+                namespace[f"default_factory_{i}"] = field.default_factory
+                lines.append(f"    {value} = default_factory_{i}()")
+            elif field.has_default:
+                namespace[f"default_{i}"] = field.default
+                lines.append(f"    {value} = default_{i}")
+            else:
+                lines.append(f"    {value} = skipped")
+            continue
+
+        sub_projection = None if projection is None else projection.fields[field.field_name]
+
+        namespace[f"key_{i}"] = field.data_key
+        known_keys.append(field.data_key)
+
+        if field.data_key == discriminator:
+            # The type_info key is never a field value, so the field is treated as missing
+            lines.append(f"    {value} = missing")
+        else:
+            lines.append(f"    {value} = data_get(key_{i}, missing)")
+
+        lines.append(f"    if {value} is not missing:")
+
+        if sub_projection is not None:
+            namespace[f"convert_{i}"] = mapper.get_projected_decoder(field.field_type, sub_projection)
+            lines.append(f"        {value} = convert_{i}({value})")
+        elif field.intern and mapper.interning:
+            namespace[f"convert_{i}"] = mapper.get_interning_decoder(field.field_type)
+            lines.append(f"        {value} = convert_{i}({value})")
+        elif field.field_type in _INLINE_TYPES:
+            namespace[f"type_{i}"] = field.field_type
+            lines.append(f"        if not isinstance({value}, type_{i}):")
+            lines.append(f"            {value} = type_{i}({value})")
+        else:
+            lazy_factory = get_field_lazy_factory(mapper, class_data, field)
+            if lazy_factory is not None:
+                namespace[f"convert_{i}"] = lazy_factory
+            else:
+                namespace[f"convert_{i}"] = mapper.get_converter_for_type(field.field_type).get_from_dict()
+            lines.append(f"        {value} = convert_{i}({value})")
+
+        lines.append("        found += 1")
+
+        if field.has_default and field.default_factory:
+            namespace[f"default_factory_{i}"] = field.default_factory
+            lines.append("    else:")
+            lines.append(f"        {value} = default_factory_{i}()")
+        elif field.has_default:
+            namespace[f"default_{i}"] = field.default
+            lines.append("    else:")
+            lines.append(f"        {value} = default_{i}")
+        else:
+            namespace[f"missing_error_{i}"] = f"Required field '{field.field_name}' is missing"
+            lines.append("    else:")
+            lines.append(f"        raise RuntimeError(missing_error_{i})")
+
+    if not resolved_data.ignore_extra and projection is None:
+        if discriminator is not None:
+            known_keys.append(discriminator)
+            lines.append("    found += 1")
+
+        namespace["known_keys"] = frozenset(known_keys)
+        lines.append("    if found != len(data):")
+        lines.append("        raise RuntimeError(f\"Extra data keys: {[k for k in data if k not in known_keys]}\")")
+
+    lines.append(f"    return cls({', '.join(args)})")
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, f"<dictparser decoder for {cls.__qualname__}>", "exec"), namespace)  # pylint: disable=exec-used
+
+    decoder = namespace["decode"]
+    decoder.__qualname__ = f"{cls.__qualname__}.__dictparser_decode__"
+
+    return decoder
+
+
+def make_class_cloner(
+    cls, field_cloners: typing.Sequence[typing.Tuple[str, typing.Optional[typing.Callable]]]
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """Generates a function that builds a new instance from the fields of an existing one
+
+    field_cloners holds (field_name, cloner) pairs, the value of the field is reused as is when cloner is None.
+    """
+    namespace: typing.Dict[str, typing.Any] = {"cls": cls}
+    args = []
+
+    for i, (field_name, cloner) in enumerate(field_cloners):
+        if cloner is None:
+            args.append(f"{field_name}=value.{field_name}")
+        else:
+            namespace[f"clone_{i}"] = cloner
+            args.append(f"{field_name}=clone_{i}(value.{field_name})")
+
+    source = f"def clone(value):\n    return cls({', '.join(args)})\n"
+    exec(compile(source, f"<dictparser cloner for {cls.__qualname__}>", "exec"), namespace)  # pylint: disable=exec-used
+
+    cloner = namespace["clone"]
+    cloner.__qualname__ = f"{cls.__qualname__}.__dictparser_clone__"
+
+    return cloner
+
+
+def make_tuple_encoder(
+    cls, field_encoders: typing.Sequence[typing.Tuple[str, typing.Optional[typing.Callable]]], type_name=_Missing
+) -> typing.Callable[[typing.Any], tuple]:
+    """Generates a function returning the field values of an instance as a tuple, in field order
+
+    When type_name is given, it is the first item of the tuple. Fields with a None encoder are stored as is.
+    """
+    namespace: typing.Dict[str, typing.Any] = {"type_name": type_name}
+    items = [] if type_name is _Missing else ["type_name"]
+
+    for i, (field_name, encoder) in enumerate(field_encoders):
+        if encoder is None:
+            items.append(f"value.{field_name}")
+        else:
+            namespace[f"encode_{i}"] = encoder
+            items.append(f"encode_{i}(value.{field_name})")
+
+    if items:
+        source = f"def encode(value):\n    return ({', '.join(items)}, )\n"
+    else:
+        source = "def encode(value):\n    return ()\n"
+    exec(compile(source, f"<dictparser tuple encoder for {cls.__qualname__}>", "exec"), namespace)  # pylint: disable=exec-used
+
+    encoder = namespace["encode"]
+    encoder.__qualname__ = f"{cls.__qualname__}.__dictparser_encode_tuple__"
+
+    return encoder
+
+
+def make_tuple_decoder(
+    cls, field_decoders: typing.Sequence[typing.Tuple[str, typing.Optional[typing.Callable]]], offset: int = 0
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """Generates the inverse of make_tuple_encoder, offset is 1 when the tuple starts with a type_name"""
+    namespace: typing.Dict[str, typing.Any] = {"cls": cls, "len": len, "RuntimeError": RuntimeError}
+    args = []
+
+    for i, (field_name, decoder) in enumerate(field_decoders):
+        if decoder is None:
+            args.append(f"{field_name}=data[{i + offset}]")
+        else:
+            namespace[f"decode_{i}"] = decoder
+            args.append(f"{field_name}=decode_{i}(data[{i + offset}])")
+
+    size = len(field_decoders) + offset
+    namespace["size_error"] = f"Expected {size} values to build {cls.__qualname__}"
+
+    lines = [
+        "def decode(data):",
+        f"    if len(data) != {size}:",
+        "        raise RuntimeError(size_error)",
+        f"    return cls({', '.join(args)})",
+    ]
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, f"<dictparser tuple decoder for {cls.__qualname__}>", "exec"), namespace)  # pylint: disable=exec-used
+
+    decoder = namespace["decode"]
+    decoder.__qualname__ = f"{cls.__qualname__}.__dictparser_decode_tuple__"
+
+    return decoder
+
+
+def make_columns_builder(
+    class_data: ClassData, column_fields: typing.Sequence[str]
+) -> typing.Callable[..., typing.Any]:
+    """Generates a function taking one value per column field, in order, and returning an instance
+
+    Fields without a column get their default value, a missing required field is an error.
+    """
+    resolved_data = class_data.resolved_data
+    cls = class_data.result_cls
+
+    namespace: typing.Dict[str, typing.Any] = {"cls": cls}
+    params = []
+    args = []
+
+    for i, field in enumerate(resolved_data.field_table):
+        if field.field_name in column_fields:
+            continue
+
+        if field.has_default and field.default_factory:
+            namespace[f"default_factory_{i}"] = field.default_factory
+            args.append(f"{field.field_name}=default_factory_{i}()")
+        elif field.has_default:
+            namespace[f"default_{i}"] = field.default
+            args.append(f"{field.field_name}=default_{i}")
+        else:
+            raise RuntimeError(f"Required field '{field.field_name}' is missing")
+
+    for i, field_name in enumerate(column_fields):
+        params.append(f"column_{i}")
+        args.append(f"{field_name}=column_{i}")
+
+    source = f"def build({', '.join(params)}):\n    return cls({', '.join(args)})\n"
+    exec(compile(source, f"<dictparser columns builder for {cls.__qualname__}>", "exec"), namespace)  # pylint: disable=exec-used
+
+    builder = namespace["build"]
+    builder.__qualname__ = f"{cls.__qualname__}.__dictparser_build_from_columns__"
+
+    return builder
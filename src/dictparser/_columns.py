@@ -0,0 +1,97 @@
+import array
+import operator
+import typing
+
+from ._dictparser_data import CLASS_DATA_FIELD_NAME, ClassData
+
+
+# array.array typecode and NumPy dtype of the field types stored in typed columns
+_NUMERIC_COLUMNS = {
+    int: ("q", "int64"),
+    float: ("d", "float64"),
+}
+
+
+def to_columns(mapper, cls, instances, numpy: bool) -> typing.Dict[str, typing.Any]:
+    class_data: ClassData = getattr(cls, CLASS_DATA_FIELD_NAME)
+    instances = instances if isinstance(instances, (list, tuple)) else list(instances)
+
+    # Columns only hold the fields of cls, subclasses (type_info children included) would lose theirs
+    others = {value.__class__ for value in instances if value.__class__ is not cls}
+    if others:
+        raise RuntimeError(f"Can not store instances of {sorted(c.__qualname__ for c in others)} as columns of {cls}")
+
+    if numpy:
+        try:
+            import numpy as np  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise RuntimeError("numpy=True requires NumPy to be installed") from e
+
+    columns = {}
+
+    for field in class_data.resolved_data.field_table:
+        values = list(map(operator.attrgetter(field.field_name), instances))
+        numeric = _NUMERIC_COLUMNS.get(field.field_type, None)
+
+        # Typed columns would turn values of other classes (bools, ints of float fields, None) into numbers
+        if numeric is not None and set(map(type, values)) <= {field.field_type}:
+            typecode, dtype = numeric
+            try:
+                if numpy:
+                    columns[field.field_name] = np.array(values, dtype=dtype)
+                else:
+                    columns[field.field_name] = array.array(typecode, values)
+                continue
+            except OverflowError:
+                # Ints too big for int64 are kept in a list
+                pass
+
+        serializer = mapper.get_converter_for_type(field.field_type).get_serializer()
+        if serializer is not None:
+            values = list(map(serializer, values))
+
+        columns[field.field_name] = values
+
+    return columns
+
+
+def from_columns(mapper, cls, columns: typing.Mapping[str, typing.Any]) -> list:
+    class_data: ClassData = getattr(cls, CLASS_DATA_FIELD_NAME)
+    fields = class_data.resolved_data.fields
+
+    extra = [name for name in columns if name not in fields]
+    if extra:
+        raise RuntimeError(f"Extra columns: {extra}")
+
+    column_fields = list(columns)
+    values = []
+    size = None
+
+    for field_name in column_fields:
+        column = columns[field_name]
+        if size is None:
+            size = len(column)
+        elif len(column) != size:
+            raise RuntimeError(f"Column '{field_name}' has {len(column)} values, expected {size}")
+
+        values.append(_decode_column(mapper.get_converter_for_type(fields[field_name].field_type), column))
+
+    if not column_fields:
+        # Nothing tells how many instances there are
+        return []
+
+    builder = mapper.get_columns_builder(cls, tuple(column_fields))
+
+    return list(map(builder, *values))
+
+
+def _decode_column(converter, column) -> typing.Iterable:
+    if hasattr(column, "tolist"):
+        # array.array and NumPy arrays, tolist gives back Python ints and floats
+        column = column.tolist()
+
+    passthrough_type = converter.passthrough_type
+    if passthrough_type is not None and set(map(type, column)) <= {passthrough_type}:
+        return column
+
+    return map(converter.get_from_dict(), column)
@@ -1,3 +1,4 @@
+import threading
 import typing
 
 
@@ -5,97 +6,118 @@ CLASS_DATA_FIELD_NAME = "__dictparser_class_data__"
 TYPE_INFO_FIELD_NAME = "__dictparser_type_info__"
 
 
+# Guards every lazily built piece of metadata: resolved class data and the Mapper converter and decoder caches.
+# A single reentrant lock, as building one of them can need any of the others
+BUILD_LOCK = threading.RLock()
+
+
 class MISSING:  # pylint: disable=too-few-public-methods
     pass
 
 
+class SKIPPED:  # pylint: disable=too-few-public-methods
+    """Value of required fields left out of a projected decode"""
+
+
 class Field:
+    __slots__ = (
+        "field_name", "field_type", "data_key", "default", "default_factory", "has_default", "is_required", "lazy",
+        "intern"
+    )
+
     def __init__(
         self,
         field_name,
         field_type,
         data_key,
         default: typing.Any = MISSING,
-        default_factory: typing.Any = MISSING
+        default_factory: typing.Any = MISSING,
+        lazy: bool = False,
+        intern: bool = False
     ):  # pylint: disable=too-many-arguments
-        self._field_name = field_name
-        self._field_type = field_type
-        self._data_key = data_key
-        self._default = None
-        self._default_factory = None
-        self._has_default = False
-        self._required = True
+        self.field_name: str = field_name
+        self.field_type = field_type
+        self.data_key: str = data_key
+        self.default: typing.Any = None
+        self.default_factory: typing.Any = None
+        self.has_default: bool = False
+        self.is_required: bool = True
+        self.lazy: bool = lazy
+        self.intern: bool = intern
 
         if default is not MISSING and default_factory is not MISSING:
             raise RuntimeError("Can not provide both default and default_factory in the same field")
 
         if default is not MISSING:
-            self._has_default = True
-            self._required = False
-            self._default = default
+            self.has_default = True
+            self.is_required = False
+            self.default = default
 
         if default_factory is not MISSING:
-            self._has_default = True
-            self._required = False
-            self._default_factory = default_factory
+            self.has_default = True
+            self.is_required = False
+            self.default_factory = default_factory
 
     def get_default_value(self):
-        if self._default_factory:
-            return self._default_factory()
+        if self.default_factory:
+            return self.default_factory()
         else:
-            return self._default
-
-    @property
-    def field_name(self) -> str:
-        return self._field_name
-
-    @property
-    def field_type(self):
-        return self._field_type
-
-    @property
-    def data_key(self) -> str:
-        return self._data_key
-
-    @property
-    def has_default(self) -> bool:
-        return self._has_default
-
-    @property
-    def is_required(self) -> bool:
-        return self._required
+            return self.default
 
 
 class ClassData:  # pylint: disable=too-few-public-methods
+    __slots__ = (
+        "result_cls", "field_defaults", "lazy_fields", "intern_fields", "data_resolver", "cloner", "_resolved_data"
+    )
+
     def __init__(self):
         self.result_cls: typing.Type = None  # type: ignore # This is to solve a chicken egg problem. It should always be non null for most of the code
         self.field_defaults: dict[str, typing.Any] = {}
+        self.lazy_fields: typing.FrozenSet[str] = frozenset()
+        self.intern_fields: typing.FrozenSet[str] = frozenset()
         self.data_resolver: typing.Callable[['ClassData'],'ResolvedClassData'] | None = None
+        self.cloner: typing.Optional[typing.Callable[[typing.Any], typing.Any]] = None  # Set on first clone
         self._resolved_data: 'ResolvedClassData | None' = None
 
     @property
     def resolved_data(self) -> 'ResolvedClassData':
-        if self._resolved_data is None:
-            if self.data_resolver is not None:
-                self._resolved_data = self.data_resolver(self)
-            else:
-                raise RuntimeError("Internal Error. Missing ClassData resolver method")
+        resolved_data = self._resolved_data
+
+        if resolved_data is None:
+            with BUILD_LOCK:
+                resolved_data = self._resolved_data
 
-        return self._resolved_data
+                if resolved_data is None:
+                    if self.data_resolver is None:
+                        raise RuntimeError("Internal Error. Missing ClassData resolver method")
+
+                    # Only published once complete
+                    resolved_data = self._resolved_data = self.data_resolver(self)
+
+        return resolved_data
 
 
 class ResolvedClassData:  # pylint: disable=too-few-public-methods
+    __slots__ = ("result_cls", "fields", "field_table", "has_required", "ignore_extra")
+
     def __init__(self, result_cls: typing.Type):
         self.result_cls = result_cls
         self.fields: typing.Dict[str, Field] = {}
+        self.field_table: typing.Tuple[Field, ...] = ()  # Same fields, in order. Set once all fields are known
         self.has_required: bool = False
         self.ignore_extra: bool = False
 
 
 class TypeInfo:  # pylint: disable=too-few-public-methods
+    __slots__ = ("parent", "cls", "data_key", "type_name", "children", "version")
+
+    # Number of type_name registrations across every TypeInfo, for caches covering more than one hierarchy
+    registrations = 0
+
     def __init__(self, parent, cls: typing.Type, data_key: str):
         self.parent: TypeInfo | None = parent
         self.cls = cls
         self.data_key = data_key
         self.type_name: typing.Optional[str] = None
         self.children: typing.Dict[str, TypeInfo] = {}
+        self.version = 0
@@ -1,33 +1,76 @@
 import dataclasses
-import copy
+import functools
 import sys
 
 from typing import get_type_hints
 
 from .mapper import Mapper
-from ._dictparser_data import MISSING, Field
+from ._dictparser_data import MISSING, BUILD_LOCK, Field
 from ._dictparser_data import CLASS_DATA_FIELD_NAME, ClassData, ResolvedClassData
 from ._dictparser_data import TYPE_INFO_FIELD_NAME, TypeInfo
-from ._type_utils import setattr_method, setattr_classmethod
+from ._type_utils import setattr_method, setattr_classmethod, add_slots, needs_weakref_slot
+from ._clone import make_cloner
 
 
-_default_mapper = Mapper()
+_default_mapper = None
 
 
-def from_dict(cls, data):
-    return _default_mapper.from_dict(cls, data)
+def get_default_mapper() -> Mapper:
+    # Created on first use, importing dictparser only to declare classes never builds it
+    global _default_mapper  # pylint: disable=global-statement
 
+    mapper = _default_mapper
+    if mapper is None:
+        with BUILD_LOCK:
+            mapper = _default_mapper
+            if mapper is None:
+                mapper = _default_mapper = Mapper()
 
-def from_file(cls, file):
-    return _default_mapper.from_file(cls, file)
+    return mapper
+
+
+def from_dict(cls, data, only=None):
+    return get_default_mapper().from_dict(cls, data, only)
+
+
+def from_dicts(cls, records, **kargs):
+    return get_default_mapper().from_dicts(cls, records, **kargs)
+
+
+def from_file(cls, file, format=None):  # pylint: disable=redefined-builtin
+    return get_default_mapper().from_file(cls, file, format)
+
+
+def iter_file(cls, file, format=None):  # pylint: disable=redefined-builtin
+    return get_default_mapper().iter_file(cls, file, format)
+
+
+def from_files(cls, paths, **kargs):
+    return get_default_mapper().from_files(cls, paths, **kargs)
+
+
+async def from_file_async(cls, file, format=None, executor=None):  # pylint: disable=redefined-builtin
+    return await get_default_mapper().from_file_async(cls, file, format, executor)
+
+
+def iter_file_async(cls, file, format=None, executor=None):  # pylint: disable=redefined-builtin
+    return get_default_mapper().iter_file_async(cls, file, format, executor)
+
+
+def prepare(*classes, recursive=True):
+    return get_default_mapper().prepare(*classes, recursive=recursive)
+
+
+def redecode(previous, data, cls=None):
+    return get_default_mapper().redecode(previous, data, cls)
 
 
 def as_dict(value):
-    return _default_mapper.as_dict(value)
+    return get_default_mapper().as_dict(value)
 
 
 def to_dict(value):
-    return _default_mapper.to_dict(value)
+    return get_default_mapper().to_dict(value)
 
 
 def get_fields(class_or_instance):
@@ -35,10 +78,13 @@ def get_fields(class_or_instance):
     if data is None:
         raise TypeError("Value needs to be a class created by dictparser or be an instance of such a class")
 
-    return tuple(data.resolved_data.fields.values())
+    return data.resolved_data.field_table
 
 
 def process_class(cls, **kargs):
+    lazy_fields = kargs.pop("lazy_fields", ())
+    intern_fields = kargs.pop("intern_fields", ())
+
     if sys.version_info >= (3, 10):
         set_cls_defaults = True
     else:
@@ -46,11 +92,30 @@ def process_class(cls, **kargs):
         if "kw_only" in kargs:
             del kargs["kw_only"]
 
+    if sys.version_info >= (3, 11):
+        slots = False
+        if kargs.get("slots", False):
+            # Instances stay weak referenceable, the dedupe table of interning mappers holds them weakly
+            kargs.setdefault("weakref_slot", needs_weakref_slot(cls))
+    else:
+        # dataclasses only skips the slots of base classes from python 3.11
+        slots = kargs.pop("slots", False)
+
     #
     #
     #
     _class_data = ClassData()
     _class_data.data_resolver = calculate_resolved_class_data
+    _class_data.lazy_fields = frozenset(lazy_fields)
+    _class_data.intern_fields = frozenset(intern_fields)
+
+    for field_name in _class_data.lazy_fields:
+        if field_name not in getattr(cls, "__annotations__", {}):
+            raise RuntimeError(f"Unknown lazy field '{field_name}'")
+
+    for field_name in _class_data.intern_fields:
+        if field_name not in getattr(cls, "__annotations__", {}):
+            raise RuntimeError(f"Unknown intern field '{field_name}'")
 
     if hasattr(cls, "__annotations__"):
         for field_name in cls.__annotations__:
@@ -80,7 +145,12 @@ def process_class(cls, **kargs):
                 elif hasattr(cls, field_name):
                     delattr(cls, field_name)
 
-    cls = _class_data.result_cls = dataclasses.dataclass(**kargs)(cls)
+    cls = dataclasses.dataclass(**kargs)(cls)
+
+    if slots:
+        cls = add_slots(cls, kargs.get("frozen", False))
+
+    _class_data.result_cls = cls
 
     setattr(cls, CLASS_DATA_FIELD_NAME, _class_data)
 
@@ -116,8 +186,11 @@ def process_type_info(cls, data_key = None, type_name = None):
         current = v_type_info
         while current is not None:
             current.children[type_name] = v_type_info
+            current.version += 1
             current = current.parent
 
+        TypeInfo.registrations += 1
+
     setattr(cls, TYPE_INFO_FIELD_NAME, v_type_info)
     return cls
 
@@ -128,7 +201,7 @@ def calculate_resolved_class_data(class_data):
     for base in class_data.result_cls.__mro__[-1:0:-1]:
         base_data = getattr(base, CLASS_DATA_FIELD_NAME, None)
         if base_data is not None:
-            for field in base_data.resolved_data.fields.values():
+            for field in base_data.resolved_data.field_table:
                 res.fields[field.field_name] = field
 
     if hasattr(class_data.result_cls, "__annotations__"):
@@ -140,20 +213,24 @@ def calculate_resolved_class_data(class_data):
             field_type = type_hints[field_name]
 
             if default is not MISSING:
-                default = _default_mapper.get_converter_for_type(field_type).convert_value(default)
+                default = get_default_mapper().get_converter_for_type(field_type).convert_value(default)
 
                 if default.__class__.__hash__ is None:
-                    def copy_factory(default):
-                        return lambda : copy.deepcopy(default)
+                    # Unhashable defaults are mutable, each instance gets a copy made for the declared type
+                    cloner = make_cloner(field_type)
 
-                    default_factory = copy_factory(default)
-                    default = MISSING
+                    if cloner is not None:
+                        default_factory = functools.partial(cloner, default)
+                        default = MISSING
 
-                    default_factory.__qualname__ = f"{class_data.result_cls.__qualname__}.__deepcopy_{field_name}_default_value__"
+            res.fields[field_name] = Field(
+                field_name, field_type, field_name, default, default_factory, field_name in class_data.lazy_fields,
+                field_name in class_data.intern_fields
+            )
 
-            res.fields[field_name] = Field(field_name, field_type, field_name, default, default_factory)
+    res.field_table = tuple(res.fields.values())
 
-    for field in res.fields.values():
+    for field in res.field_table:
         if not field.has_default:
             res.has_required = True
             break
@@ -162,9 +239,18 @@ def calculate_resolved_class_data(class_data):
 
 
 def _make_default_factory_for_dataclass(cls, class_data, field_name):
+    # The field is looked up on the first call, later calls go straight to its default factory
+    factory = None
+
     def default_factory():
-        return class_data.resolved_data.fields[field_name].get_default_value()
+        nonlocal factory
+
+        if factory is None:
+            field = class_data.resolved_data.fields[field_name]
+            factory = field.default_factory or field.get_default_value
+
+        return factory()
 
-    default_factory.__qualname__ = f"{cls.__qualname__}.__deepcopy_{field_name}_default_value__"
+    default_factory.__qualname__ = f"{cls.__qualname__}.__clone_{field_name}_default_value__"
 
     return default_factory
@@ -1,12 +1,25 @@
 # pylint: disable=R0801
 
-__all__ = ['from_dict', 'from_file', 'as_dict', 'fields', 'Field', 'dictparser', 'type_info']
+__all__ = [
+    'from_dict', 'from_dicts', 'from_file', 'iter_file', 'from_files', 'from_file_async', 'iter_file_async', 'prepare',
+    'redecode', 'as_dict', 'fields', 'Field', 'FilesLoadError', 'Projection', 'SKIPPED', 'dictparser', 'type_info'
+]
 
-from typing import Type, TypeVar, dataclass_transform
+from typing import AsyncIterator, Iterable, Iterator, Type, TypeVar, dataclass_transform
 
-from ._dictparser_data import Field
+from ._dictparser_data import Field, SKIPPED
+from ._batch import FilesLoadError
+from ._projection import Projection
+from ._prepare import PrepareReport
 from ._engine import from_dict as _from_dict
+from ._engine import from_dicts as _from_dicts
 from ._engine import from_file as _from_file
+from ._engine import iter_file as _iter_file
+from ._engine import from_files as _from_files
+from ._engine import from_file_async as _from_file_async
+from ._engine import iter_file_async as _iter_file_async
+from ._engine import prepare as _prepare
+from ._engine import redecode as _redecode
 from ._engine import to_dict as _to_dict
 from ._engine import as_dict as _as_dict
 from ._engine import get_fields as _get_fields
@@ -17,12 +30,52 @@ from ._engine import process_type_info as _process_type_info
 T = TypeVar("T")
 
 
-def from_dict(cls: Type[T], data) -> T:
-    return _from_dict(cls, data)
+def from_dict(cls: Type[T], data, only: Iterable[str] | Projection | None = None) -> T:
+    return _from_dict(cls, data, only)
 
 
-def from_file(cls: Type[T], file) -> T:
-    return _from_file(cls, file)
+def from_dicts(
+    cls: Type[T], records: Iterable, *, stream: bool = False, chunk_size: int = 1024, workers: int | None = None,
+    executor="thread"
+) -> list[T] | Iterator[T]:  # pylint: disable=too-many-arguments
+    return _from_dicts(cls, records, stream=stream, chunk_size=chunk_size, workers=workers, executor=executor)
+
+
+def from_file(cls: Type[T], file, format: str | None = None) -> T:  # pylint: disable=redefined-builtin
+    return _from_file(cls, file, format)
+
+
+def iter_file(cls: Type[T], file, format: str | None = None) -> Iterator[T]:  # pylint: disable=redefined-builtin
+    return _iter_file(cls, file, format)
+
+
+def from_files(
+    cls: Type[T], paths: Iterable, *, workers: int | None = None, executor="thread", chunk_size: int = 16,
+    return_exceptions: bool = False
+) -> list[T]:  # pylint: disable=too-many-arguments
+    return _from_files(
+        cls, paths, workers=workers, executor=executor, chunk_size=chunk_size, return_exceptions=return_exceptions
+    )
+
+
+async def from_file_async(
+    cls: Type[T], file, format: str | None = None, executor=None  # pylint: disable=redefined-builtin
+) -> T:
+    return await _from_file_async(cls, file, format, executor)
+
+
+def iter_file_async(
+    cls: Type[T], file, format: str | None = None, executor=None  # pylint: disable=redefined-builtin
+) -> AsyncIterator[T]:
+    return _iter_file_async(cls, file, format, executor)
+
+
+def prepare(*classes: type, recursive: bool = True) -> PrepareReport:
+    return _prepare(*classes, recursive=recursive)
+
+
+def redecode(previous: T | None, data, cls: Type[T] | None = None) -> T:
+    return _redecode(previous, data, cls)
 
 
 def to_dict(value):
@@ -1,10 +1,22 @@
 # pylint: disable=R0801
 
-__all__ = ['from_dict', 'from_file', 'as_dict', 'fields', 'Field', 'dictparser', 'type_info']
-
-from ._dictparser_data import Field
+__all__ = [
+    'from_dict', 'from_dicts', 'from_file', 'iter_file', 'from_files', 'from_file_async', 'iter_file_async', 'prepare',
+    'redecode', 'as_dict', 'fields', 'Field', 'FilesLoadError', 'Projection', 'SKIPPED', 'dictparser', 'type_info'
+]
+
+from ._dictparser_data import Field, SKIPPED
+from ._batch import FilesLoadError
+from ._projection import Projection
 from ._engine import from_dict as _from_dict
+from ._engine import from_dicts as _from_dicts
 from ._engine import from_file as _from_file
+from ._engine import iter_file as _iter_file
+from ._engine import from_files as _from_files
+from ._engine import from_file_async as _from_file_async
+from ._engine import iter_file_async as _iter_file_async
+from ._engine import prepare as _prepare
+from ._engine import redecode as _redecode
 from ._engine import to_dict as _to_dict
 from ._engine import as_dict as _as_dict
 from ._engine import get_fields as _get_fields
@@ -12,12 +24,46 @@ from ._engine import process_class as _process_class
 from ._engine import process_type_info as _process_type_info
 
 
-def from_dict(cls, data):
-    return _from_dict(cls, data)
+def from_dict(cls, data, only=None):
+    return _from_dict(cls, data, only)
+
+
+def from_dicts(
+    cls, records, *, stream=False, chunk_size=1024, workers=None, executor="thread"
+):  # pylint: disable=too-many-arguments
+    return _from_dicts(cls, records, stream=stream, chunk_size=chunk_size, workers=workers, executor=executor)
+
+
+def from_file(cls, file, format=None):  # pylint: disable=redefined-builtin
+    return _from_file(cls, file, format)
+
+
+def iter_file(cls, file, format=None):  # pylint: disable=redefined-builtin
+    return _iter_file(cls, file, format)
+
+
+def from_files(
+    cls, paths, *, workers=None, executor="thread", chunk_size=16, return_exceptions=False
+):  # pylint: disable=too-many-arguments
+    return _from_files(
+        cls, paths, workers=workers, executor=executor, chunk_size=chunk_size, return_exceptions=return_exceptions
+    )
+
+
+async def from_file_async(cls, file, format=None, executor=None):  # pylint: disable=redefined-builtin
+    return await _from_file_async(cls, file, format, executor)
+
+
+def iter_file_async(cls, file, format=None, executor=None):  # pylint: disable=redefined-builtin
+    return _iter_file_async(cls, file, format, executor)
+
+
+def prepare(*classes, recursive=True):
+    return _prepare(*classes, recursive=recursive)
 
 
-def from_file(cls, file):
-    return _from_file(cls, file)
+def redecode(previous, data, cls=None):
+    return _redecode(previous, data, cls)
 
 
 def to_dict(value):
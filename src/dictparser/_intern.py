@@ -0,0 +1,61 @@
+import sys
+import typing
+import weakref
+
+
+def intern_str(value) -> str:
+    return sys.intern(value if value.__class__ is str else str(value))
+
+
+class DedupeTable:
+    """Weak valued table of decoded instances, keyed by their class and field values
+
+    Holds at most max_size entries. When full it starts over, values already shared stay shared.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._table: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._table)
+
+    def __reduce__(self):
+        # Entries are never sent to other processes, only the size
+        return (DedupeTable, (self.max_size, ))
+
+    def dedupe(self, key, value):
+        existing = self._table.get(key, None)
+        if existing is not None:
+            return existing
+
+        if len(self._table) >= self.max_size:
+            self._table.clear()
+
+        self._table[key] = value
+        return value
+
+
+def make_dedupe_decoder(
+    decoder: typing.Callable[[typing.Any], typing.Any], cls, field_names: typing.Sequence[str], table: DedupeTable
+) -> typing.Callable[[typing.Any], typing.Any]:
+    """Wraps the decoder of a frozen class so that equal instances are decoded to the same object
+
+    Field values are compared with their class, so that equal values of other types (True and 1, 1 and 1.0) are
+    not merged. Floats are compared by their hex form, which tells 0.0 and -0.0 apart.
+    """
+
+    def decode_deduped(data):
+        value = decoder(data)
+
+        try:
+            key = (cls, tuple([
+                (v.__class__, v.hex() if v.__class__ is float else v)
+                for v in [getattr(value, field_name) for field_name in field_names]
+            ]))
+            return table.dedupe(key, value)
+        except TypeError:
+            # Unhashable field values (lists, dicts, ...) can not be compared structurally through the table
+            return value
+
+    return decode_deduped
@@ -0,0 +1,154 @@
+import copy
+import threading
+import types
+import typing
+
+
+# Only held while a converted value is stored in its LazyValue, conversions run outside of it
+_materialize_lock = threading.Lock()
+
+
+class LazyValue:
+    """Raw data of a lazy field, stored in the instance until the field is first read
+
+    Fields that can hold one are replaced on their class by a LazyField, see enable_lazy_field. Reading the field
+    converts the data and stores the result in the instance in place of the LazyValue. Code reading the fields, like
+    dataclass equality, dataclasses.asdict or to_dict, only ever sees converted values.
+    """
+    __slots__ = ("_convert", "_data", "_value")
+
+    def __init__(self, convert: typing.Callable[[typing.Any], typing.Any], data):
+        self._convert = convert
+        self._data = data
+        self._value = None
+
+    def materialize(self):
+        convert = self._convert
+        if convert is None:
+            return self._value
+
+        value = convert(self._data)
+
+        with _materialize_lock:
+            if self._convert is not None:
+                self._value = value
+                self._convert = None
+                self._data = None
+
+        return self._value
+
+    def __reduce_ex__(self, protocol):
+        # Pickled instances hold the converted value
+        return (_identity, (self.materialize(), ))
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.materialize(), memo)
+
+
+def _identity(value):
+    return value
+
+
+_MISSING = object()
+
+
+class LazyField:
+    """Data descriptor of a field that can hold a LazyValue, converting it on read
+
+    The value is kept where the class keeps it otherwise: the slot of slotted classes, the instance __dict__ of the
+    others. Reading the class attribute gives back what it was before, the field default.
+    """
+    __slots__ = ("name", "slot", "class_value")
+
+    def __init__(self, name: str, slot, class_value):
+        self.name = name
+        self.slot = slot
+        self.class_value = class_value
+
+    def get_raw(self, instance):
+        if self.slot is not None:
+            return self.slot.__get__(instance, instance.__class__)
+
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            if self.class_value is _MISSING:
+                raise AttributeError(self.name)
+
+            return self.class_value
+
+        value = self.get_raw(instance)
+
+        if value.__class__ is LazyValue:
+            value = value.materialize()
+            self.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance, value):
+        # Frozen classes refuse assignments in __setattr__, before this is reached
+        if self.slot is not None:
+            self.slot.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        if self.slot is not None:
+            self.slot.__delete__(instance)
+        else:
+            try:
+                del instance.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+
+
+def _find_class_attribute(cls, name: str):
+    for klass in cls.__mro__:
+        value = klass.__dict__.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+
+    return _MISSING
+
+
+def enable_lazy_field(cls, field_name: str):
+    """Replaces the field of cls by a LazyField, unless cls or one of its bases already has one"""
+    current = _find_class_attribute(cls, field_name)
+
+    if isinstance(current, LazyField):
+        return
+
+    if isinstance(current, types.MemberDescriptorType):
+        # Slot of a slotted class
+        setattr(cls, field_name, LazyField(field_name, current, _MISSING))
+    else:
+        setattr(cls, field_name, LazyField(field_name, None, current))
+
+
+def get_field_lazy_factory(mapper, class_data, field) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+    """Returns the function building the LazyValue of a field, None when the field is decoded right away
+
+    The field of the class is made a LazyField the first time, only fields that can hold a LazyValue are.
+    """
+    if not (field.lazy or mapper.lazy):
+        return None
+
+    factory = mapper.get_converter_for_type(field.field_type).get_lazy_factory()
+    if factory is not None:
+        enable_lazy_field(class_data.result_cls, field.field_name)
+
+    return factory
+
+
+def get_raw_field(value, field_name: str):
+    """Returns the stored value of a field, the LazyValue itself when it was not read yet"""
+    descriptor = _find_class_attribute(value.__class__, field_name)
+
+    if isinstance(descriptor, LazyField):
+        return descriptor.get_raw(value)
+
+    return getattr(value, field_name)
@@ -0,0 +1,77 @@
+import sys
+import typing
+
+# Parsers are imported on first use, most programs define classes without ever reading a file
+# pylint: disable=import-outside-toplevel
+
+
+class Loader:  # pylint: disable=too-few-public-methods
+    def __init__(
+        self,
+        load: typing.Optional[typing.Callable[[typing.BinaryIO], typing.Any]],
+        load_all: typing.Optional[typing.Callable[[typing.BinaryIO], typing.Iterable[typing.Any]]] = None
+    ):
+        self.load = load
+        self.load_all = load_all
+
+    def iter_documents(self, f: typing.BinaryIO) -> typing.Iterable[typing.Any]:
+        if self.load_all is not None:
+            return self.load_all(f)
+        else:
+            return iter((self.load_document(f),))
+
+    def load_document(self, f: typing.BinaryIO) -> typing.Any:
+        if self.load is None:
+            raise RuntimeError("Format does not support loading a single document")
+
+        return self.load(f)
+
+
+def _load_yaml(f):
+    import yaml
+    return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _load_all_yaml(f):
+    import yaml
+    return yaml.load_all(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _load_json(f):
+    import json
+    return json.load(f)
+
+
+def _load_all_json_lines(f):
+    import json
+
+    for line in f:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _load_toml(f):
+    import tomllib
+    return tomllib.load(f)
+
+
+def get_default_loaders() -> typing.Tuple[typing.Dict[str, Loader], typing.Dict[str, str]]:
+    loaders = {
+        "yaml": Loader(_load_yaml, _load_all_yaml),
+        "json": Loader(_load_json),
+        "jsonl": Loader(None, _load_all_json_lines),
+    }
+
+    extensions = {
+        ".yaml": "yaml",
+        ".yml": "yaml",
+        ".json": "json",
+        ".jsonl": "jsonl",
+        ".ndjson": "jsonl",
+    }
+
+    if sys.version_info >= (3, 11):
+        loaders["toml"] = Loader(_load_toml)
+        extensions[".toml"] = "toml"
+
+    return loaders, extensions
@@ -0,0 +1,68 @@
+import collections
+import time
+import typing
+
+from ._dictparser_data import CLASS_DATA_FIELD_NAME
+
+
+class PrepareStep:  # pylint: disable=too-few-public-methods
+    __slots__ = ("vtype", "step", "seconds")
+
+    def __init__(self, vtype, step: str, seconds: float):
+        self.vtype = vtype
+        self.step = step
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"PrepareStep({self.vtype!r}, {self.step!r}, {self.seconds:.6f})"
+
+
+class PrepareReport:
+    """What Mapper.prepare built, in order
+
+    Steps are "resolve" (type hints and defaults of a dictparser class), "converter" (creating the converter)
+    and "prepare" (decoders, type_info dispatch tables and serializers of the converter).
+    """
+
+    def __init__(self):
+        self.steps: typing.List[PrepareStep] = []
+
+    @property
+    def types(self) -> list:
+        return list(dict.fromkeys(step.vtype for step in self.steps))
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(step.seconds for step in self.steps)
+
+
+def _timed(report: PrepareReport, vtype, step: str, func: typing.Callable, *args):
+    start = time.perf_counter()
+    res = func(*args)
+    report.steps.append(PrepareStep(vtype, step, time.perf_counter() - start))
+    return res
+
+
+def prepare_types(mapper, types: typing.Iterable, recursive: bool) -> PrepareReport:
+    report = PrepareReport()
+
+    pending = collections.deque(types)
+    seen = set(pending)
+
+    while pending:
+        vtype = pending.popleft()
+
+        class_data = getattr(vtype, CLASS_DATA_FIELD_NAME, None)
+        if class_data is not None:
+            _timed(report, vtype, "resolve", getattr, class_data, "resolved_data")
+
+        converter = _timed(report, vtype, "converter", mapper.get_converter_for_type, vtype)
+        dependencies = _timed(report, vtype, "prepare", converter.prepare)
+
+        if recursive:
+            for dependency in dependencies:
+                if dependency not in seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+
+    return report
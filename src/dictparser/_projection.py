@@ -0,0 +1,57 @@
+import typing
+
+
+class Projection:
+    """Fields selected by a projected decode, nested fields are selected with dotted paths
+
+    Projection({"name", "children.name"}) keeps name and, from every object in children, their name. Selecting a
+    field without a nested path keeps it whole. Projections are immutable and hashable, decoders are cached per
+    projection, so one built once and reused avoids parsing the paths again.
+    """
+    __slots__ = ("fields", "_key")
+
+    def __init__(self, paths: typing.Iterable[str] = ()):
+        tree: dict = {}
+
+        for path in paths:
+            node = tree
+            parts = path.split(".")
+
+            for part in parts[:-1]:
+                child = node.setdefault(part, {})
+                if child is None:
+                    break
+                node = child
+            else:
+                node[parts[-1]] = None
+
+        self.fields: typing.Dict[str, typing.Optional[Projection]] = {}
+        self._key: frozenset = frozenset()
+        self._set_tree(tree)
+
+    def _set_tree(self, tree: dict):
+        for name, sub_tree in tree.items():
+            if sub_tree is None:
+                self.fields[name] = None
+            else:
+                sub = self.fields[name] = Projection()
+                sub._set_tree(sub_tree)  # pylint: disable=protected-access
+
+        self._key = frozenset(self.fields.items())
+
+    def __eq__(self, other):
+        return isinstance(other, Projection) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        return f"Projection({sorted(self.paths())!r})"
+
+    def paths(self) -> typing.Iterator[str]:
+        for name, sub in self.fields.items():
+            if sub is None:
+                yield name
+            else:
+                for path in sub.paths():
+                    yield f"{name}.{path}"
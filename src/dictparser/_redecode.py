@@ -0,0 +1,56 @@
+import weakref
+
+
+class SourceTable:
+    """Input data of the values returned by Mapper.redecode, kept as long as the value is alive
+
+    Values that can not be weakly referenced (slots classes, lists, ...) are kept alive by the table instead,
+    at most max_size of them. The oldest are dropped first.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self.max_size = max_size
+        # id(value) -> (weakref or value itself, data)
+        self._sources: dict = {}
+        self._strong: dict = {}
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __reduce__(self):
+        # Recorded data only describes values of this process
+        return (SourceTable, (self.max_size, ))
+
+    def get(self, value):
+        """Returns the data value was decoded from, None when it is unknown"""
+        entry = self._sources.get(id(value), None)
+        if entry is None:
+            return None
+
+        ref, data = entry
+        if ref is not value and (ref.__class__ is not weakref.ref or ref() is not value):
+            return None
+
+        return data
+
+    def record(self, value, data):
+        key = id(value)
+
+        try:
+            ref = weakref.ref(value, lambda r: self._remove(key, r))
+        except TypeError:
+            ref = value
+            self._strong.pop(key, None)
+            self._strong[key] = None
+
+            while len(self._strong) > self.max_size:
+                oldest = next(iter(self._strong))
+                del self._strong[oldest]
+                self._sources.pop(oldest, None)
+
+        self._sources[key] = (ref, data)
+
+    def _remove(self, key, ref):
+        entry = self._sources.get(key, None)
+        if entry is not None and entry[0] is ref:
+            del self._sources[key]
@@ -0,0 +1,40 @@
+import collections
+import typing
+
+from ._dictparser_data import CLASS_DATA_FIELD_NAME, TYPE_INFO_FIELD_NAME
+from ._type_utils import type_get_args
+
+
+def schema_fingerprint(vtype) -> str:
+    """Hash of everything that shapes the positional form of vtype
+
+    Covers every dictparser class reachable from it: name, field names and types in order and type_info names.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    parts = []
+    pending = collections.deque([vtype])
+    seen = {vtype}
+
+    while pending:
+        current = pending.popleft()
+        parts.append(repr(current))
+        dependencies: typing.List[typing.Any] = list(type_get_args(current))
+
+        class_data = getattr(current, CLASS_DATA_FIELD_NAME, None)
+        if class_data is not None and isinstance(current, type):
+            type_info = getattr(current, TYPE_INFO_FIELD_NAME, None)
+            if type_info is not None:
+                parts.append(f"type_info {type_info.data_key!r} {type_info.type_name!r} {type_info.cls!r}")
+                dependencies.extend(type_info.children[name].cls for name in sorted(type_info.children))
+
+            for field in class_data.resolved_data.field_table:
+                parts.append(f"{field.field_name}: {field.field_type!r}")
+                dependencies.append(field.field_type)
+
+        for dependency in dependencies:
+            if dependency not in seen:
+                seen.add(dependency)
+                pending.append(dependency)
+
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
@@ -1,5 +1,10 @@
-__all__ = ['type_get_origin', 'type_get_args', 'is_union_type', 'setattr_method', 'setattr_classmethod', 'strip_generic_from_type']
+__all__ = [
+    'type_get_origin', 'type_get_args', 'is_union_type', 'setattr_method', 'setattr_classmethod',
+    'strip_generic_from_type', 'add_slots', 'needs_weakref_slot'
+]
 
+import dataclasses
+import itertools
 import sys
 
 if sys.version_info >= (3, 10):
@@ -32,6 +37,61 @@ def setattr_classmethod(cls, method_name, func):
     setattr(cls, method_name, classmethod(func_wrapper))
 
 
+def add_slots(cls, is_frozen):
+    """Recreates a dataclass with __slots__, like dataclasses.dataclass(slots=True) does on python 3.11+"""
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+
+    inherited_slots = set(itertools.chain.from_iterable(
+        _get_slots(base) for base in cls.__mro__[1:-1]
+    ))
+
+    cls_dict["__slots__"] = tuple(name for name in field_names if name not in inherited_slots)
+    if needs_weakref_slot(cls):
+        cls_dict["__slots__"] += ("__weakref__", )
+
+    for field_name in field_names:
+        cls_dict.pop(field_name, None)
+
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    qualname = getattr(cls, "__qualname__", None)
+    cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        cls.__qualname__ = qualname
+
+    if is_frozen:
+        # Frozen instances can not be restored with setattr, which is what pickle uses for slots
+        cls.__getstate__ = _dataclass_getstate
+        cls.__setstate__ = _dataclass_setstate
+
+    return cls
+
+
+def needs_weakref_slot(cls) -> bool:
+    """Tells whether a slotted version of cls needs a __weakref__ slot, which no base class provides"""
+    return not any(base.__weakrefoffset__ for base in cls.__bases__)
+
+
+def _get_slots(cls):
+    slots = cls.__dict__.get("__slots__", ())
+
+    if isinstance(slots, str):
+        return (slots, )
+    else:
+        return slots
+
+
+def _dataclass_getstate(self):
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+
+def _dataclass_setstate(self, state):
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
 def strip_generic_from_type(vtype):
     vtype_origin = type_get_origin(vtype)
     if vtype_origin is None:
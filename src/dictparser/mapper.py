@@ -1,34 +1,90 @@
 import abc
 import collections.abc
-import pathlib
+import functools
+import itertools
+import operator
 import typing
 import os
 import sys
-import datetime
 import copy
-import yaml
 
-from ._dictparser_data import CLASS_DATA_FIELD_NAME, ClassData, TypeInfo
+from ._dictparser_data import MISSING, CLASS_DATA_FIELD_NAME, BUILD_LOCK, ClassData, TypeInfo
 from ._dictparser_data import TYPE_INFO_FIELD_NAME
 from ._type_utils import type_get_origin, type_get_args, is_union_type, strip_generic_from_type
+from ._codegen import make_class_decoder, make_tuple_encoder, make_tuple_decoder, make_columns_builder
+from ._loaders import Loader, get_default_loaders
+from ._batch import decode_records, iter_chunks, iter_parallel, load_files, collect_files
+from ._batch import SharedMapper, decode_records_shared, load_files_shared
+from ._prepare import PrepareReport, prepare_types
+from ._schema import schema_fingerprint
+from ._columns import to_columns, from_columns
+from ._projection import Projection
+from ._intern import DedupeTable, intern_str, make_dedupe_decoder
+from ._redecode import SourceTable
+from ._aio import from_file_async, iter_file_async
+from ._lazy import LazyValue, get_field_lazy_factory, get_raw_field
 
 
-_in_test = os.environ.get('PYTEST_VERSION') is not None
+VALIDATION_MODES = ("off", "sampled", "full")
 
 
+def _make_sampler(sample_every: typing.Optional[int], sample_rate: typing.Optional[float]):
+    if sample_rate is not None:
+        import random  # pylint: disable=import-outside-toplevel
+        return lambda: random.random() < sample_rate
+
+    counter = itertools.count(1)
+    return lambda: next(counter) % sample_every == 0
+
+
+def _same_data(a, b) -> bool:
+    """Tells whether a equals b with the same classes, and the keys of every dict in the same order"""
+    if a is b:
+        return True
+
+    if a.__class__ is not b.__class__:
+        return False
+
+    if a.__class__ is dict:
+        return list(a) == list(b) and all(_same_data(v, b[k]) for k, v in a.items())
+
+    if a.__class__ is list:
+        return len(a) == len(b) and all(map(_same_data, a, b))
+
+    return a == b
+
 
 class Converter(abc.ABC):
+    # Values whose class is exactly this type are returned unchanged by convert_value
+    passthrough_type: typing.Optional[type] = None
+
     def __init__(self, mapper, res_types: list):
         self.mapper = mapper
-        self.res_types = res_types
+        self.res_types = tuple(res_types)
 
     def from_dict(self, data):
-        if self.mapper.check_res_types:
-            res = self.convert_value(data)
+        res = self.convert_value(data)
+
+        validation = self.mapper.validation
+        if validation == "full" or (validation == "sampled" and self.mapper.should_sample()):
             self._validate_res_type(res)
-            return res
-        else:
-            return self.convert_value(data)
+
+        return res
+
+    def get_from_dict(self) -> typing.Callable[[typing.Any], typing.Any]:
+        """Returns the function to bind for decoding, convert_value itself when results are never validated"""
+        if self.mapper.validation == "off":
+            return self.convert_value
+
+        return self.from_dict
+
+    def make_interning_decoder(self) -> typing.Callable[[typing.Any], typing.Any]:
+        """Returns a function decoding like from_dict, with the strings of the value interned"""
+        return self.get_from_dict()
+
+    def make_projected_decoder(self, projection) -> typing.Callable[[typing.Any], typing.Any]:
+        """Returns a function decoding only the fields selected by projection, see Mapper.get_projected_decoder"""
+        raise RuntimeError(f"Can not select fields {sorted(projection.paths())} of {self.res_types}")
 
     @abc.abstractmethod
     def convert_value(self, data) -> typing.Any:
@@ -38,45 +94,399 @@ class Converter(abc.ABC):
     def serialize_value(self, value) -> typing.Any:
         pass
 
-    def _validate_res_type(self, res):
-        for i in self.res_types:
-            if isinstance(res, i):
-                return
+    def get_serializer(self) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+        """Returns the function used to serialize values of the declared type, or None when no work is needed"""
+        return self.serialize_value
+
+    def get_lazy_factory(self) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+        """Returns the function building the LazyValue of lazy fields, None when values are converted right away"""
+        return None
 
-        raise RuntimeError(f"Converted value does not match expected result type: {type(res)} vs {self.res_types}")
+    def redecode(self, previous, old_data, data):
+        """Decodes data, reusing the parts of previous, decoded from old_data, whose data did not change
+
+        Only called when old_data and data differ, see Mapper.redecode_value.
+        """
+        return self.from_dict(data)
+
+    def get_tuple_encoder(self) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+        """Returns the function used by Mapper.to_tuple for values of the declared type, or None to store them as is"""
+        return self.get_serializer()
+
+    def get_tuple_decoder(self) -> typing.Optional[typing.Callable[[typing.Any], typing.Any]]:
+        """Inverse of get_tuple_encoder, None when values are stored as is"""
+        if self.get_tuple_encoder() is None:
+            return None
+
+        return self.convert_value
+
+    def prepare(self) -> typing.Iterable:
+        """Builds everything the converter would otherwise create on first use, returns the types it depends on"""
+        return ()
+
+    def _validate_res_type(self, res):
+        if not isinstance(res, self.res_types):
+            raise RuntimeError(f"Converted value does not match expected result type: {type(res)} vs {self.res_types}")
 
 
 class Mapper:
-    def __init__(self):
-        self.check_res_types = _in_test
+    def __init__(
+        self, compiled: bool = False, copy_containers: bool = True, lazy: bool = False, validation: str = "off",
+        sample_every: typing.Optional[int] = None, sample_rate: typing.Optional[float] = None,
+        interning: bool = False, dedupe_size: int = 65536
+    ):  # pylint: disable=too-many-arguments
+        if validation not in VALIDATION_MODES:
+            raise RuntimeError(f"Unknown validation mode '{validation}'")
+
+        if sample_every is not None and sample_rate is not None:
+            raise RuntimeError("Only one of sample_every and sample_rate can be set")
+
+        if sample_every is not None and sample_every < 1:
+            raise RuntimeError(f"sample_every must be at least 1, got {sample_every}")
+
+        if sample_rate is not None and not 0 < sample_rate <= 1:
+            raise RuntimeError(f"sample_rate must be in (0, 1], got {sample_rate}")
+
+        if validation == "sampled" and sample_every is None and sample_rate is None:
+            sample_every = 100
+
+        self.validation = validation
+        self.sample_every = sample_every
+        self.sample_rate = sample_rate
+        self.should_sample = _make_sampler(sample_every, sample_rate)
+        self.compiled = compiled
+        self.copy_containers = copy_containers
+        self.lazy = lazy
         self._converters = {}
+        self._decoders = {}
+        self._fingerprints = {}
+        self._projected = {}
+        self._interning_decoders = {}
+        self._columns_builders = {}
+        # Only with interning: strings of intern_fields and dict keys are interned, equal frozen instances shared
+        self.interning = interning
+        self._dedupe_table = DedupeTable(dedupe_size)
+        self._sources = SourceTable()
+        self._loaders, self._loader_extensions = get_default_loaders()
+
+    def __getstate__(self):
+        # Caches are rebuilt on demand, only the configuration is sent to worker processes
+        state = self.__dict__.copy()
+        state["_converters"] = {}
+        state["_decoders"] = {}
+        state["_fingerprints"] = {}
+        state["_projected"] = {}
+        state["_interning_decoders"] = {}
+        state["_columns_builders"] = {}
+        del state["should_sample"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.should_sample = _make_sampler(self.sample_every, self.sample_rate)
+
+    def from_dict(self, cls, data, only=None):
+        """Converts data into an instance of cls
+
+        only is a Projection, or the paths to build one from, restricting the decode to the selected fields.
+        """
+        if only is None:
+            converter = self.get_converter_for_type(cls)
+            return converter.from_dict(data)
+
+        if not isinstance(only, Projection):
+            # Also cached by the paths, so repeated decodes with the same set do not build a Projection again
+            key = (cls, frozenset(only))
+            decoder = self._projected.get(key, None)
+
+            if decoder is None:
+                decoder = self._projected[key] = self.get_projected_decoder(cls, Projection(only))
+
+            return decoder(data)
+
+        return self.get_projected_decoder(cls, only)(data)
+
+    def redecode(self, previous, data, cls=None):
+        """Converts data into an instance of cls, reusing the objects of previous whose data is unchanged
+
+        Unchanged parts of data are found by comparing it with the data previous was decoded from, subtree by subtree,
+        so only the changed paths are decoded again. When nothing changed previous itself is returned. The data of
+        every result is recorded to compare the next call against: it must not be modified afterwards. For values
+        redecode did not return, the data is rebuilt with to_dict.
+
+        cls defaults to the class of previous. previous may be None, the data is then decoded with from_dict into cls.
+        """
+        if previous is None:
+            if cls is None:
+                raise RuntimeError("redecode needs cls when previous is None")
+
+            res = self.get_converter_for_type(cls).from_dict(data)
+        else:
+            if cls is None:
+                cls = previous.__class__
+
+            old_data = self._sources.get(previous)
+            if old_data is None:
+                old_data = self.to_dict(previous)
+
+            res = self.redecode_value(cls, previous, old_data, data)
+
+        self._sources.record(res, data)
+        return res
+
+    def redecode_value(self, vtype, previous, old_data, data):
+        """Returns previous when data equals old_data, what it was decoded from, or else the converter redecode
+
+        Dict keys must also be in the same order, it is kept by decoded dicts.
+        """
+        if _same_data(old_data, data):
+            return previous
+
+        return self.get_converter_for_type(vtype).redecode(previous, old_data, data)
+
+    def from_dicts(
+        self, cls, records, *, stream=False, chunk_size=1024, workers=None, executor="thread"
+    ):  # pylint: disable=too-many-arguments
+        if workers is None and isinstance(executor, str):
+            if stream:
+                converter = self.get_converter_for_type(cls)
+                return map(converter.get_from_dict(), records)
+
+            return decode_records(self, cls, records)
+
+        results = itertools.chain.from_iterable(iter_parallel(
+            executor,
+            workers or os.cpu_count() or 1,
+            functools.partial(decode_records_shared, SharedMapper(self), cls),
+            iter_chunks(records, chunk_size)
+        ))
 
-    def from_dict(self, cls, data):
-        converter = self.get_converter_for_type(cls)
-        return converter.from_dict(data)
+        if stream:
+            return results
 
-    def from_file(self, cls, file):
-        with open(file, "rt", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        return list(results)
+
+    def from_files(
+        self, cls, paths, *, workers=None, executor="thread", chunk_size=16, return_exceptions=False
+    ):  # pylint: disable=too-many-arguments
+        """Loads every file with from_file, returning the results in the order of paths
+
+        Files are read and decoded in a pool of workers when workers or an existing executor is given, chunk_size
+        files per task. Failed files are reported together in a FilesLoadError once every file was tried, unless
+        return_exceptions is set, then their exception takes the place of the result.
+        """
+        paths = list(paths)
+
+        if workers is None and isinstance(executor, str):
+            outcomes = load_files(self, cls, paths)
+        else:
+            outcomes = itertools.chain.from_iterable(iter_parallel(
+                executor,
+                workers or os.cpu_count() or 1,
+                functools.partial(load_files_shared, SharedMapper(self), cls),
+                iter_chunks(paths, chunk_size)
+            ))
+
+        return collect_files(paths, outcomes, return_exceptions)
+
+    def prepare(self, *classes, recursive: bool = True) -> PrepareReport:
+        """Resolves the classes and builds their converters and decoders ahead of the first decode
+
+        With recursive set, every type reachable from them is prepared too: field types (forward references
+        included), container item types and type_info subclasses.
+        """
+        return prepare_types(self, classes, recursive)
+
+    def from_file(self, cls, file, format=None):  # pylint: disable=redefined-builtin
+        loader = self.get_loader(file, format)
+
+        with open(file, "rb") as f:
+            data = loader.load_document(f)
 
         return self.from_dict(cls, data)
 
+    def iter_file(self, cls, file, format=None):  # pylint: disable=redefined-builtin
+        loader = self.get_loader(file, format)
+        decode = self.get_converter_for_type(cls).get_from_dict()
+
+        with open(file, "rb") as f:
+            for data in loader.iter_documents(f):
+                yield decode(data)
+
+    async def from_file_async(self, cls, file, format=None, executor=None):  # pylint: disable=redefined-builtin
+        """from_file, with the read and decode running in executor (the loop default one when None)"""
+        return await from_file_async(self, cls, file, format, executor)
+
+    def iter_file_async(self, cls, file, format=None, executor=None):  # pylint: disable=redefined-builtin
+        """Async iterator version of iter_file, each document is read and decoded in executor
+
+        The event loop runs between documents. Closing or cancelling the iteration closes the file.
+        """
+        return iter_file_async(self, cls, file, format, executor)
+
+    def register_loader(self, format, load, load_all=None, extensions=()):  # pylint: disable=redefined-builtin
+        self._loaders[format] = Loader(load, load_all)
+
+        for extension in extensions:
+            self._loader_extensions[extension.lower()] = format
+
+    def get_loader(self, file, format=None) -> Loader:  # pylint: disable=redefined-builtin
+        if format is None:
+            format = self._loader_extensions.get(os.path.splitext(os.fspath(file))[1].lower(), "yaml")
+
+        loader = self._loaders.get(format, None)
+        if loader is None:
+            raise RuntimeError(f"Unknown file format '{format}'")
+
+        return loader
+
     def as_dict(self, value):
-        converter = self.get_converter_for_type(type(value))
+        converter = self.get_converter_for_type(value.__class__)
         return converter.serialize_value(value)
 
     def to_dict(self, value):
-        converter = self.get_converter_for_type(type(value))
+        converter = self.get_converter_for_type(value.__class__)
         return converter.serialize_value(value)
 
+    def to_tuple(self, value, cls=None) -> tuple:
+        """Compact positional form of a value, decoded by from_tuple
+
+        Returns (fingerprint, payload). Dictparser instances in payload are tuples of their field values in field
+        order, without keys, and start with their type_name when the class has its own type_info. fingerprint
+        identifies the schema of cls, the class of value when None.
+        """
+        if cls is None:
+            cls = value.__class__
+
+        encoder = self.get_converter_for_type(cls).get_tuple_encoder()
+        return (self.get_schema_fingerprint(cls), value if encoder is None else encoder(value))
+
+    def from_tuple(self, cls, data):
+        fingerprint, payload = data
+
+        expected = self.get_schema_fingerprint(cls)
+        if fingerprint != expected:
+            raise RuntimeError(f"Schema fingerprint mismatch for {cls}: got '{fingerprint}', expected '{expected}'")
+
+        decoder = self.get_converter_for_type(cls).get_tuple_decoder()
+        return payload if decoder is None else decoder(payload)
+
+    def to_columns(self, cls, instances, numpy: bool = False) -> typing.Dict[str, typing.Any]:
+        """Returns a column per field of cls, mapping the field name to the values of every instance in order
+
+        int and float fields are stored in array.array, or NumPy arrays with numpy set, unless a value does not fit.
+        Other fields are lists of serialized values, like in to_dict. Every instance must be exactly of class cls.
+        """
+        return to_columns(self, cls, instances, numpy)
+
+    def from_columns(self, cls, columns: typing.Mapping[str, typing.Any]) -> list:
+        """Inverse of to_columns. Fields without a column take their default value"""
+        return from_columns(self, cls, columns)
+
+    def get_schema_fingerprint(self, cls) -> str:
+        # Any type_info subclass registered since can change the schema of cls
+        version = TypeInfo.registrations
+        entry = self._fingerprints.get(cls, None)
+
+        if entry is None or entry[0] != version:
+            entry = self._fingerprints[cls] = (version, schema_fingerprint(cls))
+
+        return entry[1]
+
     def get_converter_for_type(self, vtype):
         converter = self._converters.get(vtype, None)
 
         if converter is None:
-            converter = self._converters[vtype] = self._init_converter_for_type(vtype)
+            # Lock free lookups, a miss is resolved under the lock so each type is built only once
+            with BUILD_LOCK:
+                converter = self._converters.get(vtype, None)
+
+                if converter is None:
+                    converter = self._converters[vtype] = self._init_converter_for_type(vtype)
 
         return converter
 
+    def get_projected_decoder(self, vtype, projection: typing.Optional[Projection]):
+        """Returns the function decoding only the fields of vtype selected by projection, or all of them when None
+
+        Unselected fields are never read from the data, they take their default value or SKIPPED when required.
+        Decoders are generated once per (type, projection).
+        """
+        if projection is None:
+            return self.get_converter_for_type(vtype).get_from_dict()
+
+        key = (vtype, projection)
+        decoder = self._projected.get(key, None)
+
+        if decoder is None:
+            with BUILD_LOCK:
+                decoder = self._projected.get(key, None)
+
+                if decoder is None:
+                    decoder = self.get_converter_for_type(vtype).make_projected_decoder(projection)
+                    self._projected[key] = decoder
+
+        return decoder
+
+    def get_interning_decoder(self, vtype):
+        """Returns the function decoding values of vtype with every string in them interned"""
+        decoder = self._interning_decoders.get(vtype, None)
+
+        if decoder is None:
+            with BUILD_LOCK:
+                decoder = self._interning_decoders.get(vtype, None)
+
+                if decoder is None:
+                    decoder = self.get_converter_for_type(vtype).make_interning_decoder()
+                    self._interning_decoders[vtype] = decoder
+
+        return decoder
+
+    def get_columns_builder(self, cls, column_fields: typing.Tuple[str, ...]):
+        """Returns the function building an instance of cls from one value per column field, see from_columns"""
+        key = (cls, column_fields)
+        builder = self._columns_builders.get(key, None)
+
+        if builder is None:
+            with BUILD_LOCK:
+                builder = self._columns_builders.get(key, None)
+
+                if builder is None:
+                    builder = make_columns_builder(getattr(cls, CLASS_DATA_FIELD_NAME), column_fields)
+                    self._columns_builders[key] = builder
+
+        return builder
+
+    def get_decoder_for_class(self, class_data: ClassData, discriminator: typing.Optional[str] = None):
+        """Returns the function that builds an instance of the class from a mapping
+
+        When discriminator is set, it is the type_info data key, always present in the mapping and not
+        used by any of the fields.
+        """
+        key = (class_data.result_cls, discriminator)
+        decoder = self._decoders.get(key, None)
+
+        if decoder is None:
+            with BUILD_LOCK:
+                decoder = self._decoders.get(key, None)
+
+                if decoder is None:
+                    if self.compiled:
+                        decoder = make_class_decoder(self, class_data, discriminator)
+                    else:
+                        decoder = functools.partial(_decode_fields, self, class_data, discriminator)
+
+                    cls = class_data.result_cls
+                    params = getattr(cls, "__dataclass_params__", None)
+                    # Classes with eq=False compare by identity, their instances are never merged
+                    if self.interning and params is not None and params.frozen and params.eq:
+                        field_names = [field.field_name for field in class_data.resolved_data.field_table]
+                        decoder = make_dedupe_decoder(decoder, cls, field_names, self._dedupe_table)
+
+                    self._decoders[key] = decoder
+
+        return decoder
+
     def _init_converter_for_type(self, vtype) -> Converter:  # pylint: disable=too-many-return-statements,too-many-branches
         if vtype is type(None) or vtype is None:
             return NullConverter(self)
@@ -84,11 +494,14 @@ class Mapper:
         if vtype in (bool, int, float, complex, str, bytes, bytearray):
             return ConstructorConverter(self, vtype)
 
-        if vtype in (pathlib.Path,) or (isinstance(vtype, type) and issubclass(vtype, pathlib.Path)):
+        # pathlib and datetime are not imported here, a type from them can only exist once its module was loaded
+        pathlib = sys.modules.get("pathlib", None)
+        if pathlib is not None and isinstance(vtype, type) and issubclass(vtype, pathlib.Path):
             return PathlibPathConverter(self, vtype)
 
-        if vtype in (datetime.datetime, ):
-            return DatetimeConverter(self)
+        datetime = sys.modules.get("datetime", None)
+        if datetime is not None and vtype is datetime.datetime:
+            return DatetimeConverter(self, vtype)
 
         if hasattr(vtype, CLASS_DATA_FIELD_NAME):
             return DictparserConverter(self, vtype)
@@ -150,6 +563,8 @@ class Mapper:
 
 
 class NullConverter(Converter):
+    passthrough_type = type(None)
+
     def __init__(self, mapper):
         super().__init__(mapper, [type(None)])
 
@@ -162,11 +577,15 @@ class NullConverter(Converter):
     def serialize_value(self, value):
         return value
 
+    def get_serializer(self):
+        return None
+
 
 class ConstructorConverter(Converter):
     def __init__(self, mapper, vtype):
         super().__init__(mapper, [vtype])
         self.vtype = vtype
+        self.passthrough_type = vtype
 
     def convert_value(self, data):
         if isinstance(data, self.vtype):
@@ -177,11 +596,21 @@ class ConstructorConverter(Converter):
     def serialize_value(self, value):
         return value
 
+    def get_serializer(self):
+        return None
+
+    def make_interning_decoder(self):
+        if self.vtype is str:
+            return intern_str
+
+        return super().make_interning_decoder()
+
 
 class PathlibPathConverter(Converter):
     def __init__(self, mapper, vtype):
         super().__init__(mapper, [vtype])
         self.vtype = vtype
+        self.passthrough_type = vtype
 
     def convert_value(self, data):
         if isinstance(data, self.vtype):
@@ -192,68 +621,376 @@ class PathlibPathConverter(Converter):
     def serialize_value(self, value):
         return str(value)
 
+    def get_serializer(self):
+        return str
+
+
+def _decode_fields(mapper, class_data: ClassData, discriminator: typing.Optional[str], data):
+    # data belongs to the caller and is never modified
+    args = {}
+    found = 0 if discriminator is None else 1
+
+    for field in class_data.resolved_data.field_table:
+        if field.data_key in data and field.data_key != discriminator:
+            if field.intern and mapper.interning:
+                args[field.field_name] = mapper.get_interning_decoder(field.field_type)(data[field.data_key])
+            else:
+                lazy_factory = get_field_lazy_factory(mapper, class_data, field)
+                if lazy_factory is not None:
+                    args[field.field_name] = lazy_factory(data[field.data_key])
+                else:
+                    converter = mapper.get_converter_for_type(field.field_type)
+                    args[field.field_name] = converter.from_dict(data[field.data_key])
+            found += 1
+        elif field.has_default:
+            args[field.field_name] = field.get_default_value()
+        elif field.is_required:
+            raise RuntimeError(f"Required field '{field.field_name}' is missing")
+        else:
+            raise RuntimeError("ups")
+
+    if found != len(data) and not class_data.resolved_data.ignore_extra:
+        known_keys = {field.data_key for field in class_data.resolved_data.field_table}
+        known_keys.add(discriminator)
+        raise RuntimeError(f"Extra data keys: {[k for k in data if k not in known_keys]}")
+
+    return class_data.result_cls(**args)
+
+
+def _redecode_fields(
+    mapper, class_data: ClassData, discriminator: typing.Optional[str], previous, old_data, data
+):  # pylint: disable=too-many-arguments,too-many-branches
+    # Same checks as _decode_fields, values of fields present in both data are taken from previous when unchanged
+    args = {}
+    found = 0 if discriminator is None else 1
+    changed = False
+
+    for field in class_data.resolved_data.field_table:
+        lazy_factory = get_field_lazy_factory(mapper, class_data, field)
+
+        if lazy_factory is not None:
+            # Lazy values not read yet are kept as they are
+            previous_value = get_raw_field(previous, field.field_name)
+        else:
+            previous_value = getattr(previous, field.field_name)
+
+        if field.data_key in data and field.data_key != discriminator:
+            value = data[field.data_key]
+
+            if field.data_key in old_data and lazy_factory is not None:
+                # Unchanged lazy values stay unconverted, changed ones are decoded lazily again
+                old_value = old_data[field.data_key]
+                if old_value is value or (old_value.__class__ is value.__class__ and old_value == value):
+                    args[field.field_name] = previous_value
+                else:
+                    args[field.field_name] = lazy_factory(value)
+            elif field.data_key in old_data:
+                args[field.field_name] = mapper.redecode_value(
+                    field.field_type, previous_value, old_data[field.data_key], value)
+            elif field.intern and mapper.interning:
+                args[field.field_name] = mapper.get_interning_decoder(field.field_type)(value)
+            elif lazy_factory is not None:
+                args[field.field_name] = lazy_factory(value)
+            else:
+                args[field.field_name] = mapper.get_converter_for_type(field.field_type).from_dict(value)
+            found += 1
+        elif field.data_key in old_data and field.data_key != discriminator:
+            if field.has_default:
+                # old_data rebuilt by to_dict holds every default, previous keeps its value when it is the default
+                default = field.get_default_value()
+                if previous_value.__class__ is default.__class__ and previous_value == default:
+                    args[field.field_name] = previous_value
+                else:
+                    args[field.field_name] = default
+            elif field.is_required:
+                raise RuntimeError(f"Required field '{field.field_name}' is missing")
+            else:
+                raise RuntimeError("ups")
+        else:
+            # Missing from both, previous holds the default already
+            args[field.field_name] = previous_value
+
+        changed = changed or args[field.field_name] is not previous_value
+
+    if found != len(data) and not class_data.resolved_data.ignore_extra:
+        known_keys = {field.data_key for field in class_data.resolved_data.field_table}
+        known_keys.add(discriminator)
+        raise RuntimeError(f"Extra data keys: {[k for k in data if k not in known_keys]}")
+
+    if not changed:
+        return previous
+
+    return class_data.result_cls(**args)
+
 
 class DictparserConverter(Converter):
     def __init__(self, mapper, cls_type):
         super().__init__(mapper, [cls_type])
         self.cls_type = cls_type
+        self._type_info: typing.Optional[TypeInfo] = getattr(cls_type, TYPE_INFO_FIELD_NAME, None)
+        self._decoder = None
+        # (TypeInfo version, table) kept in one attribute so concurrent readers never see a mismatched pair
+        self._dispatch: typing.Tuple[int, typing.Optional[dict]] = (-1, None)
+        self._serialize_plan = None
+        # Positional values start with the type_name for classes with a type_info, own or inherited, like to_dict
+        self._tagged = self._type_info is not None
+        self._tuple_codec = None
 
     def convert_value(self, data):
         if isinstance(data, self.cls_type):
             return data
 
-        if not isinstance(data, collections.abc.Mapping):
+        # The exact dict check avoids the slower ABC based check for the common case
+        if data.__class__ is not dict and not isinstance(data, collections.abc.Mapping):
             raise RuntimeError("data is not a dict like value")
 
-        data = dict(data.items())
+        type_info = self._type_info
+        if type_info is not None:
+            version, table = self._dispatch
+            if version != type_info.version:
+                table = self._make_dispatch_table(type_info)
 
-        class_data: ClassData = getattr(self.cls_type, CLASS_DATA_FIELD_NAME)
+            if table is not None:
+                type_name = data[type_info.data_key]
+                decoder = table.get(type_name, None)
+
+                if decoder is None:
+                    raise RuntimeError(f"Unknown type_name of '{type_name}'")
+
+                return decoder(data)
+
+        decoder = self._decoder
+        if decoder is None:
+            decoder = self._decoder = self.mapper.get_decoder_for_class(getattr(self.cls_type, CLASS_DATA_FIELD_NAME))
+
+        return decoder(data)
+
+    def make_projected_decoder(self, projection):
+        type_info = self._type_info
+        classes = [self.cls_type]
+        if type_info is not None:
+            classes.extend(child.cls for child in type_info.children.values())
+
+        known = set()
+        for cls in classes:
+            known.update(getattr(cls, CLASS_DATA_FIELD_NAME).resolved_data.fields)
+
+        unknown = [name for name in projection.fields if name not in known]
+        if unknown:
+            raise RuntimeError(f"Unknown fields {unknown} of {self.cls_type}")
+
+        cls_type = self.cls_type
+        mapper = self.mapper
+
+        if type_info is None or (type_info.type_name is None and len(type_info.children) == 0):
+            class_decoder = make_class_decoder(mapper, getattr(cls_type, CLASS_DATA_FIELD_NAME), None, projection)
+
+            def decode_projected(data):
+                if isinstance(data, cls_type):
+                    return data
+
+                if data.__class__ is not dict and not isinstance(data, collections.abc.Mapping):
+                    raise RuntimeError("data is not a dict like value")
+
+                return class_decoder(data)
+
+            return decode_projected
+
+        # Same dispatch as convert_value, rebuilt when a subclass is registered later
+        dispatch = (-1, None)
+
+        def make_table():
+            table = {}
+
+            for type_name, child in type_info.children.items():
+                table[type_name] = make_class_decoder(
+                    mapper, getattr(child.cls, CLASS_DATA_FIELD_NAME), type_info.data_key, projection)
+
+            if type_info.type_name is not None:
+                table[type_info.type_name] = make_class_decoder(
+                    mapper, getattr(cls_type, CLASS_DATA_FIELD_NAME), type_info.data_key, projection)
+
+            return table
+
+        def decode_projected_type_info(data):
+            nonlocal dispatch
+
+            if isinstance(data, cls_type):
+                return data
+
+            if data.__class__ is not dict and not isinstance(data, collections.abc.Mapping):
+                raise RuntimeError("data is not a dict like value")
+
+            version, table = dispatch
+            if version != type_info.version:
+                version = type_info.version
+                table = make_table()
+                dispatch = (version, table)
 
-        type_info: typing.Optional[TypeInfo] = getattr(self.cls_type, TYPE_INFO_FIELD_NAME, None)
-        if type_info is not None and (type_info.type_name is not None or len(type_info.children) > 0):
             type_name = data[type_info.data_key]
-            del data[type_info.data_key]
+            decoder = table.get(type_name, None)
 
-            if type_name == type_info.type_name:
-                class_data = getattr(type_info.cls, CLASS_DATA_FIELD_NAME)
-            elif type_name in type_info.children:
-                class_data = getattr(type_info.children[type_name].cls, CLASS_DATA_FIELD_NAME)
-            else:
+            if decoder is None:
                 raise RuntimeError(f"Unknown type_name of '{type_name}'")
 
-        args = {}
-        keys = set(data.keys())
+            return decoder(data)
 
-        for field in class_data.resolved_data.fields.values():
-            if field.data_key in data:
-                converter = self.mapper.get_converter_for_type(field.field_type)
-                args[field.field_name] = converter.from_dict(data[field.data_key])
-                keys.remove(field.data_key)
-            elif field.has_default:
-                args[field.field_name] = field.get_default_value()
-            elif field.is_required:
-                raise RuntimeError(f"Required field '{field.field_name}' is missing")
-            else:
-                raise RuntimeError("ups")
+        return decode_projected_type_info
+
+    def get_tuple_encoder(self):
+        return self.encode_tuple
+
+    def get_tuple_decoder(self):
+        return self.decode_tuple
+
+    def encode_tuple(self, value):
+        converter = self
+
+        if value.__class__ is not self.cls_type:
+            # Subclasses use their own converter, as in serialize_value
+            converter = self.mapper.get_converter_for_type(value.__class__)
+
+        codec = converter._tuple_codec  # pylint: disable=protected-access
+        if codec is None:
+            codec = converter._make_tuple_codec()  # pylint: disable=protected-access
+
+        return codec[0](value)
+
+    def decode_tuple(self, data):
+        if self._tagged and data[0] != self._type_info.type_name:
+            child = self._type_info.children.get(data[0], None)
+            if child is None:
+                raise RuntimeError(f"Unknown type_name of '{data[0]}'")
+
+            return self.mapper.get_converter_for_type(child.cls).decode_tuple(data)
+
+        codec = self._tuple_codec
+        if codec is None:
+            codec = self._make_tuple_codec()
 
-        if len(keys) > 0 and not class_data.resolved_data.ignore_extra:
-            raise RuntimeError(f"Extra data keys: {list(keys)}")
+        return codec[1](data)
+
+    def _make_tuple_codec(self):
+        class_data: ClassData = getattr(self.cls_type, CLASS_DATA_FIELD_NAME)
+        converters = [
+            (field.field_name, self.mapper.get_converter_for_type(field.field_type))
+            for field in class_data.resolved_data.field_table
+        ]
+
+        encoders = [(field_name, converter.get_tuple_encoder()) for field_name, converter in converters]
+        decoders = [(field_name, converter.get_tuple_decoder()) for field_name, converter in converters]
+
+        if self._tagged:
+            encoder = make_tuple_encoder(self.cls_type, encoders, self._type_info.type_name)
+            decoder = make_tuple_decoder(self.cls_type, decoders, 1)
+        else:
+            encoder = make_tuple_encoder(self.cls_type, encoders)
+            decoder = make_tuple_decoder(self.cls_type, decoders)
+
+        codec = self._tuple_codec = (encoder, decoder)
+        return codec
+
+    def prepare(self):
+        class_data: ClassData = getattr(self.cls_type, CLASS_DATA_FIELD_NAME)
+        types = [field.field_type for field in class_data.resolved_data.field_table]
 
-        return class_data.result_cls(**args)
+        type_info = self._type_info
+        if type_info is not None:
+            self._make_dispatch_table(type_info)
+            types.extend(child.cls for child in type_info.children.values())
+
+        if self._decoder is None:
+            self._decoder = self.mapper.get_decoder_for_class(class_data)
+
+        if self._serialize_plan is None:
+            self._serialize_plan = self._make_serialize_plan()
+
+        return types
+
+    def _make_dispatch_table(self, type_info: TypeInfo) -> typing.Optional[dict]:
+        # Rebuilt whenever process_type_info registers a new subclass under this type_info
+        version = type_info.version
+        table = None
+
+        if type_info.type_name is not None or len(type_info.children) > 0:
+            table = {}
+
+            for type_name, child in type_info.children.items():
+                table[type_name] = self.mapper.get_decoder_for_class(
+                    getattr(child.cls, CLASS_DATA_FIELD_NAME), type_info.data_key)
+
+            if type_info.type_name is not None:
+                table[type_info.type_name] = self.mapper.get_decoder_for_class(
+                    getattr(type_info.cls, CLASS_DATA_FIELD_NAME), type_info.data_key)
+
+        self._dispatch = (version, table)
+
+        return table
 
     def serialize_value(self, value):
+        if value.__class__ is not self.cls_type:
+            # Subclasses (including type_info children) and unexpected values use their own converter
+            return self.mapper.as_dict(value)
+
+        plan = self._serialize_plan
+        if plan is None:
+            plan = self._serialize_plan = self._make_serialize_plan()
+
         res = {}
 
-        type_info: typing.Optional[TypeInfo] = getattr(value, TYPE_INFO_FIELD_NAME, None)
-        if type_info is not None and type_info.type_name is not None:
-            res[type_info.data_key] = type_info.type_name
+        type_key, type_name, fields_plan = plan
+        if type_key is not None:
+            res[type_key] = type_name
 
-        class_data: ClassData = getattr(value, CLASS_DATA_FIELD_NAME)
-        for field in class_data.resolved_data.fields.values():
-            res[field.data_key] = self.mapper.as_dict(getattr(value, field.field_name))
+        for field_name, data_key, serializer in fields_plan:
+            if serializer is None:
+                res[data_key] = getattr(value, field_name)
+            else:
+                res[data_key] = serializer(getattr(value, field_name))
 
         return res
 
+    def _make_serialize_plan(self):
+        type_key = None
+        type_name = None
+
+        type_info: typing.Optional[TypeInfo] = getattr(self.cls_type, TYPE_INFO_FIELD_NAME, None)
+        if type_info is not None and type_info.type_name is not None:
+            type_key = type_info.data_key
+            type_name = type_info.type_name
+
+        class_data: ClassData = getattr(self.cls_type, CLASS_DATA_FIELD_NAME)
+        fields_plan = tuple(
+            (field.field_name, field.data_key, self.mapper.get_converter_for_type(field.field_type).get_serializer())
+            for field in class_data.resolved_data.field_table
+        )
+
+        return type_key, type_name, fields_plan
+
+    def get_lazy_factory(self):
+        return functools.partial(LazyValue, self.from_dict)
+
+    def redecode(self, previous, old_data, data):
+        if isinstance(data, self.cls_type) or not isinstance(previous, self.cls_type):
+            return self.from_dict(data)
+
+        if not isinstance(old_data, collections.abc.Mapping) or not isinstance(data, collections.abc.Mapping):
+            return self.from_dict(data)
+
+        discriminator = None
+        type_info = self._type_info
+        if type_info is not None and (type_info.type_name is not None or len(type_info.children) > 0):
+            discriminator = type_info.data_key
+
+            if discriminator not in data or old_data.get(discriminator, None) != data[discriminator]:
+                # Another class, nothing of previous can be reused
+                return self.from_dict(data)
+        elif previous.__class__ is not self.cls_type:
+            return self.from_dict(data)
+
+        return _redecode_fields(
+            self.mapper, getattr(previous.__class__, CLASS_DATA_FIELD_NAME), discriminator, previous, old_data, data)
+
 
 class FromDictConverter(Converter):
     def __init__(self, mapper, cls_type):
@@ -269,24 +1006,127 @@ class FromDictConverter(Converter):
     def serialize_value(self, value):
         return value
 
+    def get_serializer(self):
+        return None
+
 
 class ListConverter(Converter):
     def __init__(self, mapper, res_types, item_type):
         super().__init__(mapper, res_types)
         self.item_type = item_type
+        self._item_converter: typing.Optional[Converter] = None
+        self._item_serializer = MISSING
 
     def convert_value(self, data):
-        converter = self.mapper.get_converter_for_type(self.item_type)
+        converter = self._item_converter
+        if converter is None:
+            converter = self._get_item_converter()
+
+        if converter.passthrough_type is not None and data.__class__ is list:
+            # Single pass type check, items are only converted one by one when it fails
+            if set(map(type, data)) <= {converter.passthrough_type}:
+                return list(data) if self.mapper.copy_containers else data
+
+        convert_item = converter.convert_value
         return self.res_types[0](
-            [converter.convert_value(v) for v in data]
+            [convert_item(v) for v in data]
         )
 
     def serialize_value(self, value):
+        item_serializer = self._get_item_serializer()
+
+        if item_serializer is None:
+            return list(value)
+
         return [
-            self.mapper.as_dict(v)
+            item_serializer(v)
             for v in value
         ]
 
+    def get_serializer(self):
+        if self._get_item_serializer() is None:
+            return list
+
+        return self.serialize_value
+
+    def get_lazy_factory(self):
+        if self._get_item_converter().passthrough_type is not None:
+            return None
+
+        return functools.partial(LazyValue, self.from_dict)
+
+    def make_interning_decoder(self):
+        item_decoder = self.mapper.get_interning_decoder(self.item_type)
+
+        def decode_interned(data):
+            return [item_decoder(v) for v in data]
+
+        return decode_interned
+
+    def redecode(self, previous, old_data, data):
+        # Items are matched by position, an insertion decodes every item after it again
+        if (not isinstance(previous, list) or old_data.__class__ is not list or data.__class__ is not list
+                or len(previous) != len(old_data)):
+            return self.from_dict(data)
+
+        item_type = self.item_type
+        redecode_value = self.mapper.redecode_value
+        items = [redecode_value(item_type, p, o, v) for p, o, v in zip(previous, old_data, data)]
+
+        if len(data) > len(items):
+            convert_item = self._get_item_converter().convert_value
+            items.extend([convert_item(v) for v in data[len(items):]])
+
+        if len(items) == len(previous) and all(map(operator.is_, items, previous)):
+            return previous
+
+        return self.res_types[0](items)
+
+    def make_projected_decoder(self, projection):
+        item_decoder = self.mapper.get_projected_decoder(self.item_type, projection)
+
+        def decode_projected(data):
+            return [item_decoder(v) for v in data]
+
+        return decode_projected
+
+    def get_tuple_encoder(self):
+        item_encoder = self._get_item_converter().get_tuple_encoder()
+        if item_encoder is None:
+            return list
+
+        def encode_tuple(value):
+            return [item_encoder(v) for v in value]
+
+        return encode_tuple
+
+    def get_tuple_decoder(self):
+        item_decoder = self._get_item_converter().get_tuple_decoder()
+        if item_decoder is None:
+            return list
+
+        def decode_tuple(data):
+            return [item_decoder(v) for v in data]
+
+        return decode_tuple
+
+    def prepare(self):
+        self._get_item_serializer()
+        return (self.item_type, )
+
+    def _get_item_converter(self) -> Converter:
+        # Resolved on first use so that self referencing classes can create their converters
+        if self._item_converter is None:
+            self._item_converter = self.mapper.get_converter_for_type(self.item_type)
+
+        return self._item_converter
+
+    def _get_item_serializer(self):
+        if self._item_serializer is MISSING:
+            self._item_serializer = self._get_item_converter().get_serializer()
+
+        return self._item_serializer
+
 
 class ListAnyConverter(Converter):
     def convert_value(self, data):
@@ -304,20 +1144,150 @@ class DictConverter(Converter):
         super().__init__(mapper, res_types)
         self.key_type = key_type
         self.value_type = value_type
+        self._key_converter: typing.Optional[Converter] = None
+        self._value_converter: typing.Optional[Converter] = None
+        self._value_serializer = MISSING
 
     def convert_value(self, data):
-        key_converter = self.mapper.get_converter_for_type(self.key_type)
-        value_converter = self.mapper.get_converter_for_type(self.value_type)
+        key_converter = self._key_converter
+        value_converter = self._value_converter
+        if key_converter is None or value_converter is None:
+            key_converter, value_converter = self._get_converters()
+
+        if self.mapper.interning and key_converter.passthrough_type is str:
+            # Keys repeated across many dicts share one string
+            convert_key = intern_str
+        else:
+            if (key_converter.passthrough_type is not None and value_converter.passthrough_type is not None
+                    and data.__class__ is dict):
+                # Single pass type check, items are only converted one by one when it fails
+                if (set(map(type, data.keys())) <= {key_converter.passthrough_type}
+                        and set(map(type, data.values())) <= {value_converter.passthrough_type}):
+                    return dict(data) if self.mapper.copy_containers else data
+
+            convert_key = key_converter.convert_value
+
+        convert_value = value_converter.convert_value
         return self.res_types[0](
-            [(key_converter.convert_value(k), value_converter.convert_value(v)) for k, v in data.items()]
+            [(convert_key(k), convert_value(v)) for k, v in data.items()]
         )
 
     def serialize_value(self, value):
+        value_serializer = self._get_value_serializer()
+
+        if value_serializer is None:
+            return dict(value)
+
         return {
-            k: self.mapper.as_dict(v)
+            k: value_serializer(v)
             for k,v in value.items()
         }
 
+    def get_serializer(self):
+        if self._get_value_serializer() is None:
+            return dict
+
+        return self.serialize_value
+
+    def get_lazy_factory(self):
+        key_converter, value_converter = self._get_converters()
+        if key_converter.passthrough_type is not None and value_converter.passthrough_type is not None:
+            return None
+
+        return functools.partial(LazyValue, self.from_dict)
+
+    def make_interning_decoder(self):
+        key_decoder = self.mapper.get_interning_decoder(self.key_type)
+        value_decoder = self.mapper.get_interning_decoder(self.value_type)
+
+        def decode_interned(data):
+            return {key_decoder(k): value_decoder(v) for k, v in data.items()}
+
+        return decode_interned
+
+    def redecode(self, previous, old_data, data):
+        if (not isinstance(previous, dict) or old_data.__class__ is not dict or data.__class__ is not dict
+                or len(previous) != len(old_data)):
+            return self.from_dict(data)
+
+        key_converter, value_converter = self._get_converters()
+        if self.mapper.interning and key_converter.passthrough_type is str:
+            convert_key = intern_str
+        else:
+            convert_key = key_converter.convert_value
+
+        # Keys are converted in order, so the previous items line up with the keys of old_data
+        previous_items = dict(zip(old_data, previous.items()))
+        value_type = self.value_type
+        redecode_value = self.mapper.redecode_value
+        res = {}
+        changed = False
+
+        for k, v in data.items():
+            entry = previous_items.get(k, None)
+
+            if entry is None:
+                res[convert_key(k)] = value_converter.convert_value(v)
+                changed = True
+            else:
+                key, previous_value = entry
+                value = res[key] = redecode_value(value_type, previous_value, old_data[k], v)
+                changed = changed or value is not previous_value
+
+        if not changed and len(data) == len(old_data) and list(data) == list(old_data):
+            return previous
+
+        return self.res_types[0](res)
+
+    def make_projected_decoder(self, projection):
+        key_decoder = self._get_converters()[0].get_from_dict()
+        value_decoder = self.mapper.get_projected_decoder(self.value_type, projection)
+
+        def decode_projected(data):
+            return {key_decoder(k): value_decoder(v) for k, v in data.items()}
+
+        return decode_projected
+
+    def get_tuple_encoder(self):
+        value_encoder = self._get_converters()[1].get_tuple_encoder()
+        if value_encoder is None:
+            return dict
+
+        def encode_tuple(value):
+            return {k: value_encoder(v) for k, v in value.items()}
+
+        return encode_tuple
+
+    def get_tuple_decoder(self):
+        value_decoder = self._get_converters()[1].get_tuple_decoder()
+        if value_decoder is None:
+            return dict
+
+        def decode_tuple(data):
+            return {k: value_decoder(v) for k, v in data.items()}
+
+        return decode_tuple
+
+    def prepare(self):
+        self._get_value_serializer()
+        return (self.key_type, self.value_type)
+
+    def _get_converters(self) -> typing.Tuple[Converter, Converter]:
+        # Resolved on first use so that self referencing classes can create their converters
+        if self._key_converter is None:
+            self._key_converter = self.mapper.get_converter_for_type(self.key_type)
+
+        if self._value_converter is None:
+            self._value_converter = self.mapper.get_converter_for_type(self.value_type)
+
+        return self._key_converter, self._value_converter
+
+    def _get_value_serializer(self):
+        if self._value_serializer is MISSING:
+            self._value_serializer = self._get_converters()[1].get_serializer()
+
+        return self._value_serializer
+
 
 class DictAnyAnyConverter(Converter):
     def convert_value(self, data):
@@ -334,42 +1304,113 @@ class OptionalConverter(Converter):
     def __init__(self, field_type, res_types, item_type):
         super().__init__(field_type, res_types)
         self.item_type = item_type
+        self._item_converter: typing.Optional[Converter] = None
+        self._item_serializer = MISSING
 
     def convert_value(self, data):
         if data is None:
-            converter = self.mapper.get_converter_for_type(None)
-        else:
-            converter = self.mapper.get_converter_for_type(self.item_type)
+            return None
+
+        converter = self._item_converter
+        if converter is None:
+            converter = self._get_item_converter()
 
         return converter.convert_value(data)
 
     def serialize_value(self, value):
-        return self.mapper.as_dict(value)
+        if value is None:
+            return None
+
+        item_serializer = self._get_item_serializer()
+
+        if item_serializer is None:
+            return value
+
+        return item_serializer(value)
+
+    def get_serializer(self):
+        if self._get_item_serializer() is None:
+            return None
+
+        return self.serialize_value
+
+    def get_lazy_factory(self):
+        return self._wrap_optional(self._get_item_converter().get_lazy_factory())
+
+    def make_interning_decoder(self):
+        return self._wrap_optional(self.mapper.get_interning_decoder(self.item_type))
+
+    def redecode(self, previous, old_data, data):
+        if previous is None or old_data is None or data is None:
+            return self.from_dict(data)
+
+        return self._get_item_converter().redecode(previous, old_data, data)
+
+    def make_projected_decoder(self, projection):
+        return self._wrap_optional(self.mapper.get_projected_decoder(self.item_type, projection))
+
+    def get_tuple_encoder(self):
+        return self._wrap_optional(self._get_item_converter().get_tuple_encoder())
+
+    def get_tuple_decoder(self):
+        return self._wrap_optional(self._get_item_converter().get_tuple_decoder())
+
+    @staticmethod
+    def _wrap_optional(func):
+        if func is None:
+            return None
+
+        def optional_func(value):
+            if value is None:
+                return None
+
+            return func(value)
+
+        return optional_func
+
+    def prepare(self):
+        self._get_item_serializer()
+        return (self.item_type, )
+
+    def _get_item_converter(self) -> Converter:
+        # Resolved on first use so that self referencing classes can create their converters
+        if self._item_converter is None:
+            self._item_converter = self.mapper.get_converter_for_type(self.item_type)
+
+        return self._item_converter
+
+    def _get_item_serializer(self):
+        if self._item_serializer is MISSING:
+            self._item_serializer = self._get_item_converter().get_serializer()
+
+        return self._item_serializer
 
 
 if sys.version_info >= (3, 7):
     class DatetimeConverter(Converter):
-        def __init__(self, mapper):
-            super().__init__(mapper, [datetime.datetime])
+        def __init__(self, mapper, datetime_type):
+            super().__init__(mapper, [datetime_type])
+            self.datetime_type = datetime_type
 
         def convert_value(self, data):
-            if isinstance(data, datetime.datetime):
+            if isinstance(data, self.datetime_type):
                 return copy.copy(data)
             else:
-                return datetime.datetime.fromisoformat(data)
+                return self.datetime_type.fromisoformat(data)
 
         def serialize_value(self, value):
             return value.isoformat()
 else:
     class DatetimeConverter(Converter):
-        def __init__(self, mapper):
-            super().__init__(mapper, [datetime.datetime])
+        def __init__(self, mapper, datetime_type):
+            super().__init__(mapper, [datetime_type])
+            self.datetime_type = datetime_type
 
         def convert_value(self, data):
-            if isinstance(data, datetime.datetime):
+            if isinstance(data, self.datetime_type):
                 return copy.copy(data)
             else:
-                return datetime.datetime.strptime(data, '%Y-%m-%dT%H:%M:%S')
+                return self.datetime_type.strptime(data, '%Y-%m-%dT%H:%M:%S')
 
         def serialize_value(self, value):
             return value.isoformat()
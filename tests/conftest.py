@@ -0,0 +1,10 @@
+import pytest
+
+from dictparser import _engine
+from dictparser.mapper import Mapper
+
+
+@pytest.fixture(autouse=True)
+def validating_default_mapper(monkeypatch):
+    """Checks the type of every result decoded through the module level functions"""
+    monkeypatch.setattr(_engine, "_default_mapper", Mapper(validation="full"))
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+from typing import List
+
+import pytest
+
+from dictparser import dictparser, from_file_async, iter_file_async
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class Event:
+    name: str
+    tags: List[str] = []
+
+
+def test_from_file_async(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"event{i}.yaml"
+        path.write_text(f"name: e{i}\ntags: [x]\n", encoding="utf-8")
+        paths.append(path)
+
+    async def main():
+        return await asyncio.gather(*[from_file_async(Event, path) for path in paths])
+
+    assert asyncio.run(main()) == [Event(f"e{i}", ["x"]) for i in range(5)]
+
+
+def test_iter_file_async(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"name": "a"}\n{"name": "b", "tags": ["x"]}\n', encoding="utf-8")
+
+    async def main():
+        return [v async for v in iter_file_async(Event, path)]
+
+    assert asyncio.run(main()) == [Event("a"), Event("b", ["x"])]
+
+
+def test_iter_file_async_runs_loop_between_documents(tmp_path):
+    path = tmp_path / "events.yaml"
+    path.write_text("\n---\n".join(f"name: e{i}" for i in range(3)), encoding="utf-8")
+
+    async def main():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.ensure_future(ticker())
+        seen = []
+        async for v in Mapper().iter_file_async(Event, path):
+            seen.append((v.name, len(ticks)))
+        task.cancel()
+
+        return seen
+
+    seen = asyncio.run(main())
+
+    assert [name for name, _ in seen] == ["e0", "e1", "e2"]
+    assert seen[0][1] < seen[1][1] < seen[2][1]
+
+
+def test_iter_file_async_cancel(tmp_path):
+    path = tmp_path / "events.kv"
+    path.write_bytes(b"name=a\nname=b\nname=c\n")
+
+    started = threading.Event()
+    release = threading.Event()
+    closed = []
+
+    def load_all(f):
+        try:
+            for line in f:
+                if line.startswith(b"name=b"):
+                    started.set()
+                    release.wait(5)
+                yield dict([line.decode("utf-8").strip().split("=", 1)])
+        finally:
+            closed.append(f.closed)
+
+    mapper = Mapper()
+    mapper.register_loader("kv", None, load_all, extensions=[".kv"])
+
+    async def consume(seen):
+        async for v in mapper.iter_file_async(Event, path):
+            seen.append(v)
+
+    async def main():
+        seen = []
+        task = asyncio.ensure_future(consume(seen))
+
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+
+        task.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        return seen
+
+    assert asyncio.run(main()) == [Event("a")]
+    assert closed == [False]
@@ -0,0 +1,60 @@
+import concurrent.futures
+import pickle
+
+from typing import List
+
+import pytest
+
+from dictparser import dictparser, from_dicts
+from dictparser.mapper import Mapper
+from dictparser._batch import SharedMapper
+
+
+@dictparser()
+class Record:
+    id: int
+    tags: List[str] = []
+
+
+RECORDS = [{"id": i, "tags": [str(i)]} for i in range(100)]
+EXPECTED = [Record(i, [str(i)]) for i in range(100)]
+
+
+def test_from_dicts():
+    assert from_dicts(Record, RECORDS) == EXPECTED
+    assert Record.from_dict(RECORDS[0]) == EXPECTED[0]  # type: ignore
+
+
+def test_from_dicts_stream():
+    res = from_dicts(Record, iter(RECORDS), stream=True)
+
+    assert not isinstance(res, list)
+    assert list(res) == EXPECTED
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_from_dicts_workers(executor):
+    assert from_dicts(Record, RECORDS, workers=2, chunk_size=7, executor=executor) == EXPECTED
+    assert list(from_dicts(Record, RECORDS, workers=2, chunk_size=7, executor=executor, stream=True)) == EXPECTED
+
+
+def test_from_dicts_existing_executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        assert from_dicts(Record, RECORDS, chunk_size=10, executor=executor) == EXPECTED
+
+
+def test_from_dicts_errors():
+    with pytest.raises(RuntimeError):
+        from_dicts(Record, [{"id": 1}, {}], workers=2, chunk_size=1)
+
+
+def test_shared_mapper_is_unpickled_once():
+    shared = SharedMapper(Mapper(compiled=True))
+    data = pickle.dumps(shared)
+
+    received = pickle.loads(data)
+    received.mapper.from_dict(Record, RECORDS[0])
+
+    assert pickle.loads(data) is received
+    assert Record in received.mapper._converters  # pylint: disable=protected-access
+    assert pickle.loads(pickle.dumps(SharedMapper(shared.mapper))) is not received
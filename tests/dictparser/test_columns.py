@@ -0,0 +1,129 @@
+import array
+import pathlib
+
+from typing import Optional, List
+
+import pytest
+
+from dictparser import dictparser, type_info
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class Point:
+    x: int = 0
+    y: int = 0
+
+
+@dictparser(kw_only=True)
+class Record:
+    id: int
+    score: float
+    name: str
+    active: bool = False
+    parent: Optional[int] = None
+    path: Optional[pathlib.Path] = None
+    tags: List[str] = []
+    point: Point = Point()
+
+
+@type_info()
+@dictparser(kw_only=True)
+class Shape:
+    name: str = ""
+
+
+@type_info(name="circle")
+@dictparser(kw_only=True)
+class Circle(Shape):
+    radius: float = 0.0
+
+
+RECORDS = [
+    Record(id=i, score=i / 2, name=f"r{i}", active=i % 2 == 0, parent=i - 1 if i else None,
+           path=pathlib.Path(f"p{i}"), tags=[str(i)], point=Point(i, -i))
+    for i in range(10)
+]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_columns_roundtrip(compiled):
+    mapper = Mapper(compiled=compiled)
+    columns = mapper.to_columns(Record, RECORDS)
+
+    assert list(columns) == ["id", "score", "name", "active", "parent", "path", "tags", "point"]
+    assert columns["id"] == array.array("q", range(10))
+    assert columns["score"].typecode == "d"
+    assert columns["parent"][:2] == [None, 0]
+    assert columns["path"][0] == "p0"
+    assert columns["point"][1] == {"x": 1, "y": -1}
+
+    assert mapper.from_columns(Record, columns) == RECORDS
+    assert mapper.from_columns(Record, {k: list(v) for k, v in columns.items()}) == RECORDS
+
+
+def test_columns_defaults_and_errors():
+    mapper = Mapper()
+
+    assert mapper.from_columns(Record, {"id": [1], "score": [2], "name": ["a"]}) == [Record(id=1, score=2.0, name="a")]
+
+    with pytest.raises(RuntimeError):
+        mapper.from_columns(Record, {"id": [1], "score": [2.0]})
+
+    with pytest.raises(RuntimeError):
+        mapper.from_columns(Record, {"id": [1], "score": [2.0], "name": ["a"], "unknown": [1]})
+
+    with pytest.raises(RuntimeError):
+        mapper.from_columns(Record, {"id": [1, 2], "score": [2.0], "name": ["a"]})
+
+
+def test_columns_builder_is_cached():
+    mapper = Mapper()
+    columns = {"id": [1], "score": [2.0], "name": ["a"]}
+
+    assert mapper.from_columns(Record, columns) == mapper.from_columns(Record, dict(columns))
+    assert mapper.get_columns_builder(Record, ("id", "score", "name")) is mapper.get_columns_builder(
+        Record, ("id", "score", "name"))
+    assert len(mapper._columns_builders) == 1  # pylint: disable=protected-access
+
+
+def test_columns_subclasses():
+    mapper = Mapper()
+
+    with pytest.raises(RuntimeError):
+        mapper.to_columns(Shape, [Shape(name="s"), Circle(name="c", radius=1.0)])
+
+    columns = mapper.to_columns(Circle, [Circle(name="c", radius=1.0)])
+    assert columns == {"name": ["c"], "radius": array.array("d", [1.0])}
+
+
+def test_columns_big_ints():
+    columns = Mapper().to_columns(Point, [Point(1 << 70, 0)])
+
+    assert columns["x"] == [1 << 70]
+    assert isinstance(columns["y"], array.array)
+
+
+def test_columns_keep_value_classes():
+    columns = Mapper().to_columns(Point, [Point(True, 1), Point(2, 3)])
+
+    assert columns["x"] == [True, 2]
+    assert isinstance(columns["y"], array.array)
+    assert Mapper().from_columns(Point, columns)[0].x is True
+
+    columns = Mapper().to_columns(Record, [Record(id=1, score=1, name="a")])
+    assert columns["score"] == [1]
+
+
+def test_columns_numpy():
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        with pytest.raises(RuntimeError):
+            Mapper().to_columns(Point, [Point()], numpy=True)
+        return
+
+    columns = Mapper().to_columns(Record, RECORDS, numpy=True)
+
+    assert columns["id"].dtype.name == "int64"
+    assert Mapper().from_columns(Record, columns) == RECORDS
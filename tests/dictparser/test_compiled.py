@@ -0,0 +1,73 @@
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, type_info
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class ClassA:
+    enable: bool
+    extra: bool = False
+
+
+@dictparser(kw_only=True)
+class TopLevel:
+    a1: int
+    a2: float = 1.5
+    a3: Optional[str] = None
+    b1: List[int] = [1, 2]
+    b2: Dict[str, ClassA] = {}
+    c1: Optional[ClassA] = None
+    c2: List['TopLevel'] = []
+
+
+@type_info()
+@dictparser()
+class Base:
+    common: int = 1
+
+
+@type_info(name='Child')
+@dictparser()
+class Child(Base):
+    value: str = "child"
+
+
+@pytest.mark.parametrize("cls,data", [
+    (ClassA, {"enable": True}),
+    (ClassA, {"enable": 1, "extra": 0}),
+    (TopLevel, {"a1": "3"}),
+    (TopLevel, {"a1": 1, "a2": 2, "a3": "a3", "b1": [3], "b2": {"k": {"enable": True}}, "c1": {"enable": False}}),
+    (TopLevel, {"a1": 1, "c2": [{"a1": 2, "c2": [{"a1": 3}]}]}),
+    (Base, {"@type": "Child", "value": "v"}),
+    (Child, {"@type": "Child", "common": 3}),
+])
+def test_compiled_matches_interpreted(cls, data):
+    assert Mapper(compiled=True).from_dict(cls, data) == Mapper().from_dict(cls, data)
+
+
+@pytest.mark.parametrize("cls,data,message", [
+    (ClassA, {}, "Required field 'enable' is missing"),
+    (ClassA, {"enable": True, "unknown": 1}, "Extra data keys: ['unknown']"),
+    (TopLevel, {"a1": 1, "c2": [{}]}, "Required field 'a1' is missing"),
+    (Base, {"@type": "Child", "other": 1}, "Extra data keys: ['other']"),
+    (ClassA, [], "data is not a dict like value"),
+])
+def test_compiled_errors(cls, data, message):
+    for mapper in (Mapper(), Mapper(compiled=True)):
+        with pytest.raises(RuntimeError) as exc_info:
+            mapper.from_dict(cls, data)
+
+        assert str(exc_info.value) == message
+
+
+def test_compiled_defaults_are_not_shared():
+    mapper = Mapper(compiled=True)
+
+    v1 = mapper.from_dict(TopLevel, {"a1": 1})
+    v2 = mapper.from_dict(TopLevel, {"a1": 1})
+
+    v1.b1.append(3)
+    assert v2.b1 == [1, 2]
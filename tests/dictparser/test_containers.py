@@ -0,0 +1,47 @@
+from typing import List, Dict
+
+from dictparser import dictparser
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class Metrics:
+    values: List[float]
+    labels: Dict[str, str]
+
+
+def test_homogeneous_containers_are_copied():
+    data = {"values": [1.0, 2.0], "labels": {"a": "b"}}
+    v = Mapper().from_dict(Metrics, data)
+
+    assert v.values == [1.0, 2.0]
+    assert v.labels == {"a": "b"}
+    assert v.values is not data["values"]
+    assert v.labels is not data["labels"]
+
+
+def test_homogeneous_containers_without_copy():
+    data = {"values": [1.0, 2.0], "labels": {"a": "b"}}
+    v = Mapper(copy_containers=False).from_dict(Metrics, data)
+
+    assert v.values is data["values"]
+    assert v.labels is data["labels"]
+
+
+def test_mixed_containers_are_converted():
+    for mapper in (Mapper(), Mapper(copy_containers=False)):
+        data = {"values": [1.0, 2, "3"], "labels": {"a": 1}}
+        v = mapper.from_dict(Metrics, data)
+
+        assert v.values == [1.0, 2.0, 3.0]
+        assert [type(i) for i in v.values] == [float, float, float]
+        assert v.labels == {"a": "1"}
+        assert v.values is not data["values"]
+        assert v.labels is not data["labels"]
+
+
+def test_non_list_input_is_converted():
+    v = Mapper(copy_containers=False).from_dict(Metrics, {"values": (1.0, 2.0), "labels": {}})
+
+    assert v.values == [1.0, 2.0]
+    assert isinstance(v.values, list)
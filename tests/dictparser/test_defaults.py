@@ -0,0 +1,82 @@
+from typing import Optional, List, Dict
+
+from dictparser import dictparser, from_dict
+from dictparser._dictparser_data import CLASS_DATA_FIELD_NAME
+
+
+@dictparser()
+class Inner:
+    flag: bool = False
+    values: List[int] = []
+
+
+@dictparser()
+class InnerChild(Inner):
+    extra: Dict[str, int] = {}
+
+
+@dictparser(frozen=True)
+class Frozen:
+    name: str = ""
+    parent: Optional['Frozen'] = None
+
+
+@dictparser()
+class Counted:
+    values: List[int] = []
+
+    def __post_init__(self):
+        self.values.append(len(self.values))
+
+
+@dictparser(kw_only=True)
+class Outer:
+    numbers: List[int] = [1, 2]
+    counts: Dict[str, int] = {"a": 1}
+    inner: Inner = Inner(True, [1])
+    inners: List[Inner] = [Inner(True), InnerChild(extra={"x": 1})]
+    by_name: Dict[str, List[Inner]] = {"a": [Inner()]}
+    frozen: Frozen = Frozen("f")
+    optional: Optional[Inner] = Inner()
+    counted: Counted = Counted()
+
+
+def test_defaults_are_independent():
+    a = Outer()
+    b = from_dict(Outer, {})
+
+    assert a == b
+
+    a.numbers.append(3)
+    a.counts["b"] = 2
+    a.inner.values.append(2)
+    a.inners[0].values.append(1)
+    a.inners[1].extra["y"] = 2
+    a.by_name["a"][0].flag = True
+    a.optional.flag = True
+
+    assert b == Outer()
+    assert Outer().inners == [Inner(True), InnerChild(extra={"x": 1})]
+
+
+def test_default_clones_keep_classes():
+    v = Outer()
+
+    assert type(v.inners[1]) is InnerChild  # pylint: disable=unidiomatic-typecheck
+    assert v.inners[1] is not Outer().inners[1]
+
+
+def test_immutable_defaults_are_shared():
+    assert Outer().frozen is Outer().frozen
+
+
+def test_default_clones_skip_post_init():
+    assert Outer().counted.values == [0]
+    assert Outer().counted is not Outer().counted
+
+
+def test_cloners_are_kept_by_their_class():
+    Outer()
+
+    assert getattr(Inner, CLASS_DATA_FIELD_NAME).cloner is not None
+    assert getattr(InnerChild, CLASS_DATA_FIELD_NAME).cloner is not None
@@ -151,3 +151,11 @@ def test_available_fields():
 
         if expected["has_default"]:
             assert field.get_default_value() == expected["default_value"]
+
+
+def test_fields_table():
+    fields = dictparser.fields(TopLevel)
+
+    assert isinstance(fields, tuple)
+    assert fields is dictparser.fields(TopLevel)
+    assert not hasattr(fields[0], "__dict__")
@@ -0,0 +1,129 @@
+import sys
+
+from typing import List
+
+import pytest
+
+from dictparser import dictparser, from_file, iter_file, from_files, FilesLoadError
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class Event:
+    name: str
+    tags: List[str] = []
+
+
+@dictparser(slots=True, frozen=True)
+class FrozenEvent:
+    name: str
+    tags: List[str] = []
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "event.yaml"
+    path.write_text("name: a\ntags: [x, y]\n", encoding="utf-8")
+
+    assert from_file(Event, path) == Event("a", ["x", "y"])
+    assert Event.from_file(path) == Event("a", ["x", "y"])  # type: ignore
+
+
+def test_iter_file_yaml(tmp_path):
+    path = tmp_path / "events.yaml"
+    path.write_text("name: a\n---\nname: b\ntags: [x]\n", encoding="utf-8")
+
+    assert list(iter_file(Event, path)) == [Event("a"), Event("b", ["x"])]
+
+
+def test_iter_file_json_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"name": "a"}\n\n{"name": "b", "tags": ["x"]}\n', encoding="utf-8")
+
+    res = iter_file(Event, path)
+
+    assert next(res) == Event("a")
+    assert next(res) == Event("b", ["x"])
+    assert list(res) == []
+
+
+def test_from_file_json(tmp_path):
+    path = tmp_path / "event.json"
+    path.write_text('{"name": "a", "tags": ["x"]}', encoding="utf-8")
+
+    assert from_file(Event, path) == Event("a", ["x"])
+
+
+def test_from_file_explicit_format(tmp_path):
+    path = tmp_path / "event.txt"
+    path.write_text('{"name": "a"}', encoding="utf-8")
+
+    assert from_file(Event, path, format="json") == Event("a")
+
+    with pytest.raises(RuntimeError):
+        from_file(Event, path, format="unknown")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib requires python 3.11")
+def test_from_file_toml(tmp_path):
+    path = tmp_path / "event.toml"
+    path.write_text('name = "a"\ntags = ["x"]\n', encoding="utf-8")
+
+    assert from_file(Event, path) == Event("a", ["x"])
+
+
+def test_register_loader(tmp_path):
+    path = tmp_path / "event.kv"
+    path.write_bytes(b"name=a\n")
+
+    def load_kv(f):
+        return dict(line.decode("utf-8").strip().split("=", 1) for line in f)
+
+    mapper = Mapper()
+    mapper.register_loader("kv", load_kv, extensions=[".kv"])
+
+    assert mapper.from_file(Event, path) == Event("a")
+    assert list(mapper.iter_file(Event, path)) == [Event("a")]
+
+
+def _write_events(tmp_path, count):
+    paths = []
+
+    for i in range(count):
+        path = tmp_path / f"event{i}.yaml"
+        path.write_text(f"name: e{i}\ntags: [x]\n", encoding="utf-8")
+        paths.append(path)
+
+    return paths
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"workers": 2, "chunk_size": 3},
+    {"workers": 2, "chunk_size": 3, "executor": "process"},
+])
+def test_from_files(tmp_path, options):
+    paths = _write_events(tmp_path, 10)
+
+    assert from_files(Event, paths, **options) == [Event(f"e{i}", ["x"]) for i in range(10)]
+    assert from_files(FrozenEvent, paths, **options) == [FrozenEvent(f"e{i}", ["x"]) for i in range(10)]
+    assert Mapper(lazy=True, compiled=True).from_files(FrozenEvent, paths, **options)[3] == FrozenEvent("e3", ["x"])
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_from_files_errors(tmp_path, executor):
+    paths = _write_events(tmp_path, 4)
+    paths[1].write_text("tags: [x]\n", encoding="utf-8")
+    paths.append(tmp_path / "missing.yaml")
+
+    with pytest.raises(FilesLoadError) as e:
+        from_files(Event, paths, workers=2, chunk_size=2, executor=executor)
+
+    assert [path for path, _ in e.value.errors] == [paths[1], paths[4]]
+    assert isinstance(e.value.errors[0][1], RuntimeError)
+    assert isinstance(e.value.errors[1][1], FileNotFoundError)
+
+    res = from_files(Event, paths, workers=2, executor=executor, return_exceptions=True)
+
+    assert res[0] == Event("e0", ["x"])
+    assert isinstance(res[1], RuntimeError)
+    assert isinstance(res[4], FileNotFoundError)
@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import dictparser
+
+
+# Cumulative time of `import dictparser`, including the stdlib modules it needs, as reported by -X importtime.
+# Measured around 45ms, the margin only absorbs the noise of the machine
+IMPORT_TIME_BUDGET_US = 60_000
+
+LAZY_MODULES = ("yaml", "json", "tomllib", "concurrent.futures", "pathlib", "random", "asyncio")
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.path.dirname(os.path.dirname(dictparser.__file__))
+
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _import_time_us(stderr: str) -> int:
+    for line in stderr.splitlines():
+        _, _, cumulative, name = line.replace("|", ":").split(":")
+        if name.strip() == "dictparser":
+            return int(cumulative)
+
+    raise AssertionError("dictparser not found in -X importtime output")
+
+
+def test_import_does_not_load_parsers():
+    code = f"import sys, dictparser; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+
+    assert _run_python(code).stdout.strip() == ""
+
+
+def test_class_definition_does_not_load_parsers():
+    code = "\n".join([
+        "import sys",
+        "from typing import List",
+        "from dictparser import dictparser, from_dict",
+        "@dictparser()",
+        "class Item:",
+        "    names: List[str] = []",
+        "assert from_dict(Item, {'names': ['a']}) == Item(['a'])",
+        f"print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))",
+    ])
+
+    assert _run_python(code).stdout.strip() == ""
+
+
+def test_import_time_budget():
+    # Best of several runs, the first one may also be compiling bytecode
+    best = min(_import_time_us(_run_python("import dictparser").stderr) for _ in range(10))
+
+    assert best < IMPORT_TIME_BUDGET_US
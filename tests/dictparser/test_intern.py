@@ -0,0 +1,145 @@
+import gc
+import pickle
+import weakref
+
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser
+from dictparser.mapper import Mapper
+
+
+@dictparser(frozen=True)
+class Region:
+    name: str
+    zone: int = 0
+
+
+@dictparser(frozen=True)
+class Tagged:
+    tags: List[str]
+
+
+@dictparser(frozen=True)
+class Position:
+    x: float = 0.0
+
+
+@dictparser(frozen=True, slots=True)
+class SlottedRegion:
+    name: str
+    zone: int = 0
+
+
+@dictparser(frozen=True, eq=False)
+class Handle:
+    name: str
+
+
+@dictparser(kw_only=True, intern_fields=("status", "aliases", "labels", "previous"))
+class Host:
+    name: str
+    status: str
+    aliases: List[str] = []
+    labels: Dict[str, str] = {}
+    previous: Optional[str] = None
+    counts: Dict[str, int] = {}
+    region: Optional[Region] = None
+    tagged: Optional[Tagged] = None
+
+
+def _make_data(i):
+    # New string objects on every call, like a parser produces them
+    return {
+        "name": "".join(["host", str(i)]),
+        "status": "".join(["run", "ning"]),
+        "aliases": ["".join(["a", "lias"])],
+        "labels": {"".join(["k", "ey"]): "".join(["va", "lue"])},
+        "previous": "".join(["sto", "pped"]),
+        "counts": {"".join(["c", "ount"]): 1},
+        "region": {"name": "".join(["eu", "-west"]), "zone": 1},
+        "tagged": {"tags": ["x"]},
+    }
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_interning(compiled):
+    mapper = Mapper(compiled=compiled, interning=True)
+    a = mapper.from_dict(Host, _make_data(1))
+    b = mapper.from_dict(Host, _make_data(2))
+
+    assert a.status is b.status
+    assert a.aliases[0] is b.aliases[0]
+    assert list(a.labels)[0] is list(b.labels)[0]
+    assert a.labels["key"] is b.labels["key"]
+    assert a.previous is b.previous
+    assert list(a.counts)[0] is list(b.counts)[0]
+    assert a.name is not b.name
+    assert a.region is b.region
+    assert a.tagged is not b.tagged
+    assert a.tagged == b.tagged
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_interning_off(compiled):
+    mapper = Mapper(compiled=compiled)
+    a = mapper.from_dict(Host, _make_data(1))
+    b = mapper.from_dict(Host, _make_data(2))
+
+    assert a.status is not b.status
+    assert a.region is not b.region
+    assert a == mapper.from_dict(Host, _make_data(1))
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_dedupe_keeps_value_types(compiled):
+    mapper = Mapper(compiled=compiled, interning=True)
+
+    flag = mapper.from_dict(Region, {"name": "r", "zone": True})
+    number = mapper.from_dict(Region, {"name": "r", "zone": 1})
+    assert flag.zone is True
+    assert number.zone == 1 and number.zone is not True
+
+    assert str(mapper.from_dict(Position, {"x": 0.0}).x) == "0.0"
+    assert str(mapper.from_dict(Position, {"x": -0.0}).x) == "-0.0"
+    assert mapper.from_dict(Position, {"x": 1.5}) is mapper.from_dict(Position, {"x": 1.5})
+
+    assert mapper.from_dict(Handle, {"name": "h"}) is not mapper.from_dict(Handle, {"name": "h"})
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_dedupe_slotted_classes(compiled):
+    mapper = Mapper(compiled=compiled, interning=True)
+
+    a = mapper.from_dict(SlottedRegion, {"name": "r", "zone": 1})
+    assert a is mapper.from_dict(SlottedRegion, {"name": "r", "zone": 1})
+    assert weakref.ref(a)() is a
+    assert not hasattr(a, "__dict__")
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_dedupe_table_is_weak_and_bounded():
+    mapper = Mapper(interning=True, dedupe_size=2)
+
+    regions = [mapper.from_dict(Region, {"name": "r", "zone": i}) for i in range(3)]
+    assert len(mapper._dedupe_table) <= 2  # pylint: disable=protected-access
+
+    del regions
+    gc.collect()
+    assert len(mapper._dedupe_table) == 0  # pylint: disable=protected-access
+
+
+def test_interning_pickle():
+    mapper = pickle.loads(pickle.dumps(Mapper(interning=True, dedupe_size=10)))
+
+    assert mapper.interning
+    assert mapper._dedupe_table.max_size == 10  # pylint: disable=protected-access
+    assert mapper.from_dict(Region, {"name": "r"}) is mapper.from_dict(Region, {"name": "r"})
+
+
+def test_unknown_intern_field():
+    with pytest.raises(RuntimeError):
+        @dictparser(intern_fields=("unknown", ))
+        class Invalid:  # pylint: disable=unused-variable
+            name: str
@@ -0,0 +1,145 @@
+import copy
+import dataclasses
+import pickle
+
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, from_dict, to_dict
+from dictparser.mapper import Mapper
+from dictparser._lazy import LazyField
+
+
+@dictparser(kw_only=True)
+class Leaf:
+    name: str
+    size: int = 0
+
+
+@dictparser(kw_only=True)
+class Section:
+    leaves: List[Leaf] = []
+    by_name: Dict[str, Leaf] = {}
+    main: Optional[Leaf] = None
+    numbers: List[int] = []
+
+
+@dictparser(kw_only=True, lazy_fields=("sections", ))
+class Config:
+    name: str
+    sections: Dict[str, Section] = {}
+    eager: List[Leaf] = []
+
+
+DATA = {
+    "name": "config",
+    "sections": {
+        "a": {
+            "leaves": [{"name": "a1", "size": "1"}],
+            "by_name": {"a2": {"name": "a2"}},
+            "main": {"name": "a3"},
+            "numbers": [1, 2],
+        },
+    },
+    "eager": [{"name": "e1"}],
+}
+
+
+@pytest.mark.parametrize("mapper", [Mapper(lazy=True), Mapper(lazy=True, compiled=True)])
+def test_lazy_mapper_matches_eager(mapper):
+    eager = Mapper().from_dict(Config, DATA)
+    lazy = mapper.from_dict(Config, DATA)
+
+    assert lazy == eager
+    assert eager == lazy
+    assert mapper.to_dict(lazy) == to_dict(eager)
+    assert isinstance(lazy.sections["a"].main, Leaf)
+    assert lazy.sections["a"].main.name == "a3"
+    assert repr(lazy) == repr(eager)
+
+
+@pytest.mark.parametrize("mapper", [Mapper(lazy=True), Mapper(lazy=True, compiled=True)])
+def test_lazy_errors_are_deferred(mapper):
+    v = mapper.from_dict(Section, {"main": {"size": 1}, "leaves": [{"name": "ok"}]})
+
+    assert v.leaves[0].name == "ok"
+
+    with pytest.raises(RuntimeError):
+        v.main  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize("mapper", [Mapper(), Mapper(compiled=True)])
+def test_lazy_fields(mapper):
+    v = mapper.from_dict(Config, {"name": "c", "sections": {"a": {"main": {}}}})
+
+    with pytest.raises(RuntimeError):
+        len(v.sections)
+
+    with pytest.raises(RuntimeError):
+        mapper.from_dict(Config, {"name": "c", "eager": [{}]})
+
+
+@pytest.mark.parametrize("mapper", [Mapper(lazy=True), Mapper(lazy=True, compiled=True)])
+def test_lazy_values_are_real_values(mapper):
+    eager = Mapper().from_dict(Config, DATA)
+    lazy = mapper.from_dict(Config, DATA)
+    section = lazy.sections["a"]
+
+    assert type(lazy.sections) is dict  # pylint: disable=unidiomatic-typecheck
+    assert type(section.leaves) is list  # pylint: disable=unidiomatic-typecheck
+    assert [Leaf(name="z")] + section.leaves == [Leaf(name="z"), Leaf(name="a1", size=1)]
+    assert {**section.by_name} == {"a2": Leaf(name="a2")}
+    assert dataclasses.is_dataclass(section.main)
+
+    assert dataclasses.asdict(lazy) == dataclasses.asdict(eager)
+    assert dataclasses.replace(section.main, size=2) == Leaf(name="a3", size=2)
+    assert dataclasses.replace(mapper.from_dict(Config, DATA)) == eager
+
+
+@dictparser(kw_only=True, slots=True)
+class SlottedSection:
+    leaves: List[Leaf] = []
+    numbers: List[int] = []
+
+
+def test_eager_instances_are_not_intercepted():
+    Mapper(lazy=True).from_dict(Config, DATA)
+    Mapper(lazy=True, compiled=True).from_dict(Config, DATA)
+
+    # Only fields that can hold a LazyValue read through a descriptor, other fields and classes are untouched
+    assert Leaf.__getattribute__ is object.__getattribute__
+    assert Section.__getattribute__ is object.__getattribute__
+    assert not any(isinstance(v, LazyField) for v in vars(Leaf).values())
+    assert not isinstance(vars(Section).get("numbers"), LazyField)
+    assert isinstance(vars(Section)["leaves"], LazyField)
+
+    eager = from_dict(Section, DATA["sections"]["a"])
+    assert "leaves" in vars(eager)
+    assert eager.leaves == [Leaf(name="a1", size=1)]
+
+
+def test_lazy_slotted_class():
+    v = Mapper(lazy=True).from_dict(SlottedSection, {"leaves": [{"name": "a"}], "numbers": [1]})
+
+    assert isinstance(vars(SlottedSection)["leaves"], LazyField)
+    assert type(v.leaves) is list  # pylint: disable=unidiomatic-typecheck
+    assert v == SlottedSection(leaves=[Leaf(name="a")], numbers=[1])
+    assert pickle.loads(pickle.dumps(v)) == v
+
+
+def test_lazy_copy_and_pickle():
+    v = Mapper(lazy=True).from_dict(Config, DATA)
+
+    assert pickle.loads(pickle.dumps(v.sections)) == from_dict(Config, DATA).sections
+    assert pickle.loads(pickle.dumps(Mapper(lazy=True).from_dict(Config, DATA))) == from_dict(Config, DATA)
+    assert copy.deepcopy(Mapper(lazy=True).from_dict(Config, DATA)) == from_dict(Config, DATA)
+    assert type(copy.deepcopy(v.sections["a"].leaves)) is list  # pylint: disable=unidiomatic-typecheck
+    assert copy.copy(v.sections["a"].main) == Leaf(name="a3")
+
+
+def test_unknown_lazy_field():
+    with pytest.raises(RuntimeError):
+        @dictparser(lazy_fields=("unknown", ))
+        class Invalid:  # pylint: disable=unused-variable
+            name: str
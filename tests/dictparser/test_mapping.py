@@ -0,0 +1,33 @@
+import types
+
+from typing import Dict, List
+
+import pytest
+
+from dictparser import dictparser
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class Item:
+    name: str
+    values: List[int]
+    labels: Dict[str, str]
+
+
+@pytest.mark.parametrize("mapper", [Mapper(), Mapper(compiled=True)])
+def test_mapping_input_is_not_modified(mapper):
+    data = {"name": "a", "values": [1, "2"], "labels": {"a": "b"}}
+
+    assert mapper.from_dict(Item, data) == Item("a", [1, 2], {"a": "b"})
+    assert data == {"name": "a", "values": [1, "2"], "labels": {"a": "b"}}
+
+
+@pytest.mark.parametrize("mapper", [Mapper(), Mapper(compiled=True)])
+def test_read_only_mapping_input(mapper):
+    data = types.MappingProxyType({"name": "a", "values": [1], "labels": {}})
+
+    assert mapper.from_dict(Item, data) == Item("a", [1], {})
+
+    with pytest.raises(RuntimeError):
+        mapper.from_dict(Item, types.MappingProxyType({"name": "a", "values": [1], "labels": {}, "extra": 1}))
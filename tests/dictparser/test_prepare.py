@@ -0,0 +1,67 @@
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, type_info, prepare, from_dict, to_dict
+from dictparser.mapper import Mapper
+
+
+@type_info(data_key="kind")
+@dictparser(kw_only=True)
+class Shape:
+    name: str = ""
+
+
+@type_info(name="circle")
+@dictparser(kw_only=True)
+class Circle(Shape):
+    radius: float = 0.0
+
+
+@dictparser(kw_only=True)
+class Point:
+    x: int = 0
+    y: int = 0
+
+
+@dictparser(kw_only=True)
+class Drawing:
+    shapes: List[Shape] = []
+    anchors: Dict[str, 'Point'] = {}
+    parent: Optional['Drawing'] = None
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_prepare(compiled):
+    mapper = Mapper(compiled=compiled)
+    report = mapper.prepare(Drawing)
+
+    assert set(report.types) >= {Drawing, Shape, Circle, Point, List[Shape], Dict[str, Point], Optional[Drawing]}
+    assert {step.step for step in report.steps} == {"resolve", "converter", "prepare"}
+    assert report.total_seconds >= 0
+
+    converters = dict(mapper._converters)  # pylint: disable=protected-access
+    decoders = dict(mapper._decoders)  # pylint: disable=protected-access
+
+    data = {"shapes": [{"kind": "circle", "radius": 1}], "anchors": {"a": {"x": 1}}, "parent": {}}
+    v = mapper.from_dict(Drawing, data)
+
+    assert isinstance(v.shapes[0], Circle)
+    assert mapper.to_dict(v)["shapes"] == [{"kind": "circle", "name": "", "radius": 1.0}]
+    assert mapper._converters == converters  # pylint: disable=protected-access
+    assert mapper._decoders == decoders  # pylint: disable=protected-access
+
+
+def test_prepare_not_recursive():
+    mapper = Mapper()
+    report = mapper.prepare(Point, recursive=False)
+
+    assert report.types == [Point]
+    assert [step.step for step in report.steps] == ["resolve", "converter", "prepare"]
+
+
+def test_module_prepare():
+    report = prepare(Drawing, Point)
+
+    assert Circle in report.types
+    assert from_dict(Drawing, to_dict(Drawing(anchors={"a": Point(x=1)}))) == Drawing(anchors={"a": Point(x=1)})
@@ -0,0 +1,99 @@
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, type_info, from_dict, Projection, SKIPPED
+from dictparser.mapper import Mapper
+
+
+@type_info(data_key="kind", name="item")
+@dictparser(kw_only=True)
+class Item:
+    id: int
+    label: str = ""
+
+
+@type_info(name="big")
+@dictparser(kw_only=True)
+class BigItem(Item):
+    size: int = 0
+
+
+@dictparser(kw_only=True)
+class Node:
+    name: str
+    value: int = 0
+    children: List['Node'] = []
+    items: Dict[str, Item] = {}
+    parent: Optional['Node'] = None
+
+
+DATA = {
+    "name": "root",
+    "value": "1",
+    "children": [
+        {"name": "a", "value": 2, "children": [{"name": "aa"}]},
+        {"name": "b", "items": {"x": {"kind": "big", "id": 1, "size": 3}}},
+    ],
+    "items": {"y": {"kind": "item", "id": 2, "label": "l"}},
+    "parent": {"name": "p", "unknown": {"not": "decoded"}},
+}
+
+
+MAPPERS = [Mapper(), Mapper(compiled=True), Mapper(validation="full")]
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_projection(mapper):
+    v = mapper.from_dict(Node, DATA, only={"name", "children.name"})
+
+    assert v.name == "root"
+    assert v.value == 0
+    assert v.items == {}
+    assert v.parent is None
+    assert [c.name for c in v.children] == ["a", "b"]
+    assert v.children[0].children == []
+    assert v.children[0].value == 0
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_projection_whole_fields(mapper):
+    projection = Projection(["children", "children.name", "items.id", "items.size", "parent.name"])
+
+    v = mapper.from_dict(Node, DATA, only=projection)
+
+    assert v.name is SKIPPED
+    assert v.children == from_dict(Node, {"name": "r", "children": DATA["children"]}).children
+    assert v.items["y"] == Item(id=2)
+    assert v.children[1].items["x"] == BigItem(id=1, size=3)
+    assert v.parent.name == "p"
+
+
+def test_projection_cache():
+    mapper = Mapper()
+    projection = Projection(["name", "children.name"])
+
+    assert projection == Projection(["children.name", "name"])
+    assert hash(projection) == hash(Projection(["children.name", "name"]))
+    assert sorted(projection.paths()) == ["children.name", "name"]
+    assert mapper.get_projected_decoder(Node, projection) is mapper.get_projected_decoder(Node, Projection(["name", "children.name"]))
+
+    mapper.from_dict(Node, DATA, only=["name"])
+    count = len(mapper._projected)  # pylint: disable=protected-access
+    mapper.from_dict(Node, DATA, only=["name"])
+
+    assert len(mapper._projected) == count  # pylint: disable=protected-access
+
+
+def test_projection_errors():
+    with pytest.raises(RuntimeError):
+        from_dict(Node, DATA, only={"unknown"})
+
+    with pytest.raises(RuntimeError):
+        from_dict(Node, DATA, only={"name.length"})
+
+    with pytest.raises(RuntimeError):
+        from_dict(Node, {"value": 1}, only={"name"})
+
+    with pytest.raises(RuntimeError):
+        from_dict(Node, {"name": "a", "items": {"x": {"kind": "other", "id": 1}}}, only={"items.id"})
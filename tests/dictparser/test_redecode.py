@@ -0,0 +1,227 @@
+import copy
+import gc
+import pickle
+
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, type_info, from_dict, redecode
+from dictparser.mapper import Mapper
+
+
+@dictparser(kw_only=True)
+class Leaf:
+    name: str
+    size: int = 0
+
+
+@type_info(data_key="kind")
+@dictparser(kw_only=True)
+class Shape:
+    label: str = ""
+
+
+@type_info(name="circle")
+@dictparser(kw_only=True)
+class Circle(Shape):
+    radius: float = 0
+
+
+@type_info(name="square")
+@dictparser(kw_only=True)
+class Square(Shape):
+    side: float = 0
+
+
+@dictparser(kw_only=True)
+class Section:
+    leaves: List[Leaf] = []
+    by_name: Dict[str, Leaf] = {}
+    main: Optional[Leaf] = None
+
+
+@dictparser(kw_only=True, lazy_fields=("lazy", ))
+class Config:
+    name: str
+    sections: Dict[str, Section] = {}
+    shapes: List[Shape] = []
+    lazy: List[Leaf] = []
+
+
+DATA = {
+    "name": "config",
+    "sections": {
+        "a": {
+            "leaves": [{"name": "a1", "size": "1"}, {"name": "a2"}],
+            "by_name": {"a3": {"name": "a3"}},
+            "main": {"name": "a4"},
+        },
+        "b": {"leaves": [{"name": "b1"}]},
+    },
+    "shapes": [{"kind": "circle", "radius": 1}, {"kind": "square", "side": 2}],
+    "lazy": [{"name": "l1"}],
+}
+
+
+MAPPERS = [Mapper(), Mapper(compiled=True), Mapper(validation="full")]
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_redecode_unchanged(mapper):
+    previous = mapper.redecode(None, DATA, Config)
+
+    assert previous == from_dict(Config, DATA)
+    assert mapper.redecode(previous, copy.deepcopy(DATA)) is previous
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_redecode_reuses_unchanged_subtrees(mapper):
+    previous = mapper.redecode(None, DATA, Config)
+
+    data = copy.deepcopy(DATA)
+    data["sections"]["a"]["leaves"][1]["size"] = 5
+    current = mapper.redecode(previous, data)
+
+    assert current == from_dict(Config, data)
+    assert current is not previous
+    assert current.sections["a"] is not previous.sections["a"]
+    assert current.sections["a"].leaves[1] is not previous.sections["a"].leaves[1]
+    assert current.sections["a"].leaves[0] is previous.sections["a"].leaves[0]
+    assert current.sections["a"].by_name is previous.sections["a"].by_name
+    assert current.sections["a"].main is previous.sections["a"].main
+    assert current.sections["b"] is previous.sections["b"]
+    assert current.shapes is previous.shapes
+
+    # Compared with the data of the last result
+    data = copy.deepcopy(data)
+    data["shapes"][1]["side"] = 3
+    latest = mapper.redecode(current, data)
+
+    assert latest == from_dict(Config, data)
+    assert latest.sections is current.sections
+    assert latest.shapes[0] is current.shapes[0]
+    assert latest.shapes[1].side == 3
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_redecode_structure_changes(mapper):
+    previous = mapper.redecode(None, DATA, Config)
+
+    data = copy.deepcopy(DATA)
+    data["sections"]["c"] = {"main": {"name": "c1"}}
+    del data["sections"]["b"]
+    data["sections"]["a"]["leaves"].append({"name": "a5"})
+    data["sections"]["a"].pop("main")
+    data["shapes"][0] = {"kind": "square", "side": 1}
+    current = mapper.redecode(previous, data)
+
+    assert current == from_dict(Config, data)
+    assert current.sections["a"].leaves[0] is previous.sections["a"].leaves[0]
+    assert current.sections["a"].main is None
+    assert isinstance(current.shapes[0], Square)
+    assert current.shapes[1] is previous.shapes[1]
+
+    # Back to the original data
+    assert mapper.redecode(current, DATA) == previous
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_redecode_key_order(mapper):
+    previous = mapper.redecode(None, DATA, Config)
+
+    data = copy.deepcopy(DATA)
+    data["sections"] = {"b": data["sections"]["b"], "a": data["sections"]["a"]}
+    current = mapper.redecode(previous, data)
+
+    assert current is not previous
+    assert list(current.sections) == ["b", "a"]
+    assert current.sections["a"] is previous.sections["a"]
+    assert current.shapes is previous.shapes
+
+
+@pytest.mark.parametrize("mapper", MAPPERS)
+def test_redecode_errors(mapper):
+    previous = mapper.redecode(None, DATA, Config)
+
+    data = copy.deepcopy(DATA)
+    data["sections"]["a"]["unknown"] = 1
+    with pytest.raises(RuntimeError):
+        mapper.redecode(previous, data)
+
+    data = copy.deepcopy(DATA)
+    del data["sections"]["a"]["leaves"][0]["name"]
+    with pytest.raises(RuntimeError):
+        mapper.redecode(previous, data)
+
+    data = copy.deepcopy(DATA)
+    data["shapes"][0]["kind"] = "triangle"
+    with pytest.raises(RuntimeError):
+        mapper.redecode(previous, data)
+
+    with pytest.raises(RuntimeError):
+        mapper.redecode(None, DATA)
+
+    # Failed calls record nothing
+    assert mapper.redecode(previous, copy.deepcopy(DATA)) is previous
+
+
+def test_redecode_lazy_fields():
+    mapper = Mapper()
+    previous = mapper.redecode(None, DATA, Config)
+
+    data = copy.deepcopy(DATA)
+    data["lazy"].append({})
+    current = mapper.redecode(previous, data)
+
+    with pytest.raises(RuntimeError):
+        len(current.lazy)
+
+    data = copy.deepcopy(DATA)
+    data["name"] = "other"
+    assert mapper.redecode(previous, data).lazy is previous.lazy
+
+
+def test_redecode_without_recorded_data():
+    mapper = Mapper()
+    previous = mapper.from_dict(Config, DATA)
+
+    # Compared with to_dict of previous, where defaults are set and size is 1 and not "1"
+    data = copy.deepcopy(DATA)
+    data["name"] = "other"
+    current = mapper.redecode(previous, data)
+
+    assert current == from_dict(Config, data)
+    assert current.sections is previous.sections
+    assert current.sections["a"].main is previous.sections["a"].main
+
+    # Omitted defaults do not count as changes
+    leaf = mapper.from_dict(Leaf, {"name": "x"})
+    assert mapper.redecode(leaf, {"name": "x"}) is leaf
+    section = mapper.from_dict(Section, DATA["sections"]["b"])
+    assert mapper.redecode(section, DATA["sections"]["b"]) is section
+
+    data = mapper.to_dict(previous)
+    data["name"] = "other"
+    current = redecode(previous, data)
+
+    assert current == from_dict(Config, data)
+    assert current.sections is previous.sections
+    assert current.shapes is previous.shapes
+
+
+def test_redecode_recorded_data_is_released():
+    mapper = Mapper()
+    previous = mapper.redecode(None, DATA, Config)
+    assert len(mapper._sources) == 1  # pylint: disable=protected-access
+
+    del previous
+    gc.collect()
+    assert len(mapper._sources) == 0  # pylint: disable=protected-access
+
+    values = [mapper.redecode(None, [{"name": str(i)}], List[Leaf]) for i in range(100)]
+    assert len(mapper._sources) == 64  # pylint: disable=protected-access
+    assert mapper.redecode(values[-1], [{"name": "99"}]) is values[-1]
+
+    copied = pickle.loads(pickle.dumps(mapper))
+    assert len(copied._sources) == 0  # pylint: disable=protected-access
@@ -1,6 +1,6 @@
 import sys
 
-from typing import Optional, List
+from typing import Optional, List, Dict
 from dictparser import dictparser, from_dict, to_dict
 
 
@@ -11,6 +11,12 @@ class ClassA:
     children: List['ClassA'] = []
 
 
+@dictparser(kw_only=True)
+class ClassB:
+    name: str
+    groups: Optional[List[Dict[str, 'ClassB']]] = None
+
+
 if sys.version_info >= (3, 11):
     @dictparser(kw_only=True)
     class ClassA310:
@@ -43,3 +49,22 @@ def test_unions():
                 {'name': '1.2', 'special_one': None, 'children': []},
             ]
         }
+
+
+def test_nested_containers():
+    initial_data = {
+        'name': '1',
+        'groups': [
+            {'a': {'name': '1.a', 'groups': [{'b': {'name': '1.a.b'}}]}},
+            {},
+        ]
+    }
+
+    for _ in range(2):
+        assert to_dict(from_dict(ClassB, initial_data)) == {
+            'name': '1',
+            'groups': [
+                {'a': {'name': '1.a', 'groups': [{'b': {'name': '1.a.b', 'groups': None}}]}},
+                {},
+            ]
+        }
@@ -0,0 +1,75 @@
+import pathlib
+
+from datetime import datetime
+from typing import Optional, List, Dict
+
+from dictparser import dictparser, type_info, to_dict
+
+
+@type_info(data_key="kind")
+@dictparser()
+class Shape:
+    name: str = "shape"
+
+
+@type_info(name="circle")
+@dictparser()
+class Circle(Shape):
+    radius: float = 1.0
+
+
+@dictparser()
+class Plain:
+    value: int = 0
+
+
+@dictparser()
+class PlainChild(Plain):
+    other: int = 1
+
+
+@dictparser(kw_only=True)
+class Container:
+    numbers: List[int]
+    mapping: Dict[str, int]
+    when: Optional[datetime] = None
+    path: Optional[pathlib.Path] = None
+    shapes: List[Shape] = []
+    plain: Optional[Plain] = None
+    nested: Dict[str, List[Plain]] = {}
+    anything: list = []
+
+
+def test_serialize_declared_types():
+    value = Container(
+        numbers=[1, 2, 3],
+        mapping={"a": 1},
+        when=datetime(2000, 1, 2),
+        path=pathlib.Path("a/b"),
+        shapes=[Circle("c", 2.0)],
+        plain=PlainChild(1, 2),
+        nested={"x": [Plain(3)]},
+        anything=[Plain(4), datetime(2000, 1, 3)],
+    )
+
+    assert to_dict(value) == {
+        "numbers": [1, 2, 3],
+        "mapping": {"a": 1},
+        "when": "2000-01-02T00:00:00",
+        "path": "a/b",
+        "shapes": [{"kind": "circle", "name": "c", "radius": 2.0}],
+        "plain": {"value": 1, "other": 2},
+        "nested": {"x": [{"value": 3}]},
+        "anything": [{"value": 4}, "2000-01-03T00:00:00"],
+    }
+
+
+def test_serialize_copies_containers():
+    value = Container(numbers=[1, 2, 3], mapping={"a": 1})
+    res = to_dict(value)
+
+    res["numbers"].append(4)
+    res["mapping"]["b"] = 2
+
+    assert value.numbers == [1, 2, 3]
+    assert value.mapping == {"a": 1}
@@ -0,0 +1,66 @@
+import copy
+import dataclasses
+import pickle
+
+from typing import List, Optional
+
+from dictparser import dictparser, from_dict, to_dict, fields
+from dictparser._type_utils import add_slots
+
+
+@dictparser(slots=True)
+class Base:
+    name: str
+    tags: List[str] = []
+
+
+@dictparser(slots=True, kw_only=True)
+class Node(Base):
+    child: Optional['Node'] = None
+
+
+@dictparser(slots=True, frozen=True)
+class Frozen:
+    value: int = 0
+
+
+def test_slotted_classes():
+    v = from_dict(Node, {"name": "a", "child": {"name": "b", "tags": ["x"]}})
+
+    assert v == Node(name="a", child=Node(name="b", tags=["x"]))
+    assert not hasattr(v, "__dict__")
+    assert Node.__slots__ == ("child",)
+
+    assert to_dict(v) == {"name": "a", "tags": [], "child": {"name": "b", "tags": ["x"], "child": None}}
+    assert v.as_dict() == to_dict(v)  # type: ignore
+    assert Node.from_dict({"name": "c"}) == Node(name="c")  # type: ignore
+    assert [field.field_name for field in fields(Node)] == ["name", "tags", "child"]
+
+
+def test_slotted_defaults_are_not_shared():
+    v1 = from_dict(Base, {"name": "a"})
+    v2 = from_dict(Base, {"name": "b"})
+
+    v1.tags.append("x")
+    assert not v2.tags
+
+
+def test_slotted_frozen_pickle():
+    v = from_dict(Frozen, {"value": 1})
+
+    assert pickle.loads(pickle.dumps(v)) == v
+
+
+def test_add_slots():
+    @dataclasses.dataclass(frozen=True)
+    class Plain:
+        a: int
+        b: str = "b"
+
+    cls = add_slots(Plain, True)
+
+    assert cls.__slots__ == ("a", "b", "__weakref__")
+    assert cls.__qualname__ == Plain.__qualname__
+    assert not hasattr(cls(1), "__dict__")
+    assert cls(1).b == "b"
+    assert copy.copy(cls(1, "c")) == cls(1, "c")
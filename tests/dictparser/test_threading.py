@@ -0,0 +1,107 @@
+import collections
+import concurrent.futures
+import threading
+import time
+
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, type_info
+from dictparser.mapper import Mapper
+
+
+THREADS = 32
+
+
+def _run_concurrently(func):
+    barrier = threading.Barrier(THREADS)
+
+    def worker():
+        barrier.wait()
+        return func()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return [f.result() for f in [pool.submit(worker) for _ in range(THREADS)]]
+
+
+@type_info(data_key="kind")
+@dictparser(kw_only=True)
+class Node:
+    name: str
+    children: List['Node'] = []
+    by_name: Dict[str, 'Node'] = {}
+    parent: Optional['Node'] = None
+
+
+@type_info(name="leaf")
+@dictparser(kw_only=True)
+class Leaf(Node):
+    size: int = 0
+
+
+@dictparser()
+class Unresolved:
+    nodes: List[Node]
+
+
+DATA = {
+    "kind": "leaf",
+    "name": "root",
+    "children": [{"kind": "leaf", "name": "a", "size": "1"}],
+    "by_name": {"b": {"kind": "leaf", "name": "b"}},
+}
+
+
+def _count_calls(obj, name, counter):
+    method = getattr(obj, name)
+
+    def wrapper(*args):
+        counter[args] += 1
+        time.sleep(0.001)  # Widens the window where other threads could race the build
+        return method(*args)
+
+    setattr(obj, name, wrapper)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_concurrent_first_decode(compiled):
+    mapper = Mapper(compiled=compiled, validation="full")
+
+    converters = collections.Counter()
+    _count_calls(mapper, "_init_converter_for_type", converters)
+
+    results = _run_concurrently(lambda: mapper.from_dict(Node, DATA))
+
+    assert all(isinstance(v, Leaf) for v in results)
+    assert all(v == results[0] for v in results)
+    assert all(count == 1 for count in converters.values())
+    assert len(mapper._decoders) == len(set(mapper._decoders.values()))  # pylint: disable=protected-access
+
+
+def test_concurrent_class_resolution():
+    class_data = Unresolved.__dictparser_class_data__
+    resolver = class_data.data_resolver
+    calls = []
+
+    def counting_resolver(data):
+        calls.append(data)
+        time.sleep(0.001)
+        return resolver(data)
+
+    class_data.data_resolver = counting_resolver
+
+    results = _run_concurrently(lambda: class_data.resolved_data)
+
+    assert len(calls) == 1
+    assert all(v is results[0] for v in results)
+
+
+def test_concurrent_decode_stress():
+    mapper = Mapper(compiled=True)
+    expected = Mapper().from_dict(Node, DATA)
+
+    def decode_many():
+        return all(mapper.from_dict(Node, DATA) == expected for _ in range(200))
+
+    assert all(_run_concurrently(decode_many))
@@ -0,0 +1,141 @@
+import datetime
+import pathlib
+import pickle
+
+from typing import Optional, List, Dict
+
+import pytest
+
+from dictparser import dictparser, type_info, to_dict
+from dictparser.mapper import Mapper
+
+
+@type_info(data_key="kind")
+@dictparser(kw_only=True)
+class Shape:
+    name: str = ""
+
+
+@type_info(name="circle")
+@dictparser(kw_only=True)
+class Circle(Shape):
+    radius: float = 0.0
+
+
+@dictparser(kw_only=True)
+class Node:
+    value: int
+    children: List['Node'] = []
+    shapes: Dict[str, Shape] = {}
+    parent: Optional['Node'] = None
+    path: Optional[pathlib.Path] = None
+    created: Optional[datetime.datetime] = None
+
+
+@dictparser(kw_only=True)
+class Plain:
+    name: str = ""
+
+
+@dictparser(kw_only=True)
+class PlainChild(Plain):
+    size: int = 0
+
+
+@dictparser(kw_only=True)
+class Empty:
+    pass
+
+
+@dictparser(kw_only=True)
+class Holder:
+    empty: Empty
+    items: List[Empty] = []
+
+
+@type_info(data_key="kind")
+@dictparser(kw_only=True)
+class Animal:
+    name: str = ""
+
+
+VALUE = Node(
+    value=1,
+    children=[Node(value=2), Node(value=3, parent=Node(value=4))],
+    shapes={"a": Circle(name="c", radius=1.5), "b": Shape(name="s")},
+    path=pathlib.Path("a/b"),
+    created=datetime.datetime(2020, 1, 2, 3, 4, 5),
+)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_tuple_roundtrip(compiled):
+    mapper = Mapper(compiled=compiled)
+    data = mapper.to_tuple(VALUE)
+
+    assert mapper.from_tuple(Node, data) == VALUE
+    assert Mapper().from_tuple(Node, pickle.loads(pickle.dumps(data))) == VALUE
+    assert len(pickle.dumps(data)) < len(pickle.dumps(mapper.to_dict(VALUE)))
+
+
+def test_tuple_layout():
+    fingerprint, payload = Mapper().to_tuple(Circle(name="c", radius=1.0))
+
+    assert isinstance(fingerprint, str)
+    assert payload == ("circle", "c", 1.0)
+    assert Mapper().to_tuple(Plain(name="p"))[1] == ("p", )
+
+
+def test_tuple_fingerprint_mismatch():
+    mapper = Mapper()
+
+    with pytest.raises(RuntimeError):
+        mapper.from_tuple(Plain, mapper.to_tuple(PlainChild(name="p"), Plain))
+
+    with pytest.raises(RuntimeError):
+        mapper.from_tuple(Plain, ("0" * 16, ("p", )))
+
+    assert mapper.get_schema_fingerprint(Node) != mapper.get_schema_fingerprint(Plain)
+    assert mapper.get_schema_fingerprint(Node) == Mapper().get_schema_fingerprint(Node)
+
+
+def test_tuple_invalid_payload():
+    mapper = Mapper()
+    fingerprint = mapper.get_schema_fingerprint(Shape)
+
+    with pytest.raises(RuntimeError):
+        mapper.from_tuple(Shape, (fingerprint, ("square", "s")))
+
+    with pytest.raises(RuntimeError):
+        mapper.from_tuple(Shape, (fingerprint, ("circle", "c")))
+
+
+def test_tuple_empty_class():
+    mapper = Mapper()
+    value = Holder(empty=Empty(), items=[Empty()])
+    data = mapper.to_tuple(value)
+
+    assert data[1] == ((), [()])
+    assert mapper.from_tuple(Holder, data) == value
+
+
+def test_tuple_plain_subclass():
+    mapper = Mapper()
+    value = Node(value=1, shapes={"a": Circle(name="c")})
+
+    assert to_dict(PlainChild(name="p", size=1)) == {"name": "p", "size": 1}
+    assert mapper.to_tuple(PlainChild(name="p", size=1), Plain)[1] == ("p", 1)
+    assert mapper.from_tuple(Node, mapper.to_tuple(value)) == value
+
+
+def test_tuple_fingerprint_follows_type_info():
+    mapper = Mapper()
+    fingerprint = mapper.get_schema_fingerprint(Animal)
+
+    @type_info(name="dog")
+    @dictparser(kw_only=True)
+    class Dog(Animal):
+        barks: bool = True
+
+    assert mapper.get_schema_fingerprint(Animal) != fingerprint
+    assert mapper.from_tuple(Animal, mapper.to_tuple(Dog(name="d"), Animal)) == Dog(name="d")
@@ -1,6 +1,7 @@
 import pytest
 
 from dictparser import dictparser, type_info, from_dict, to_dict
+from dictparser.mapper import Mapper
 
 
 @type_info(data_key="type")
@@ -68,3 +69,31 @@ def test_to_dict():
     assert to_dict(A2(1, "a2")) == {"type": "A2", "common": 1, "a": "a2"}
     assert to_dict(B1(1, "b1")) == {"type": "B1", "common": 1, "b": "b1"}
     assert to_dict(B2(1, "b2")) == {"type": "B2", "common": 1, "b": "b2"}
+
+
+def test_from_dict_does_not_modify_input():
+    data = {"type": "A2", "a": "x"}
+
+    for mapper in (Mapper(), Mapper(compiled=True)):
+        assert mapper.from_dict(Base, data) == A2(1, "x")
+        assert data == {"type": "A2", "a": "x"}
+
+
+def test_subclass_registered_after_first_decode():
+    @type_info()
+    @dictparser()
+    class Root:
+        common: int = 1
+
+    mapper = Mapper()
+    assert mapper.from_dict(Root, {"common": 2}) == Root(2)
+
+    @type_info(name="Late")
+    @dictparser()
+    class Late(Root):
+        late: int = 2
+
+    assert mapper.from_dict(Root, {"@type": "Late", "late": 3}) == Late(1, 3)
+
+    with pytest.raises(RuntimeError):
+        mapper.from_dict(Root, {"@type": "Other"})
@@ -0,0 +1,79 @@
+import pickle
+
+from typing import List
+
+import pytest
+
+from dictparser import dictparser
+from dictparser.mapper import Mapper
+
+
+@dictparser()
+class Item:
+    name: str
+    values: List[int] = []
+
+
+def _broken_converter(mapper):
+    converter = mapper.get_converter_for_type(List[int])
+    converter.convert_value = lambda data: tuple(data)
+    return converter
+
+
+def test_validation_off():
+    converter = _broken_converter(Mapper())
+
+    assert converter.from_dict([1, 2]) == (1, 2)
+    assert converter.get_from_dict() == converter.convert_value
+
+
+def test_validation_full():
+    converter = _broken_converter(Mapper(validation="full"))
+
+    with pytest.raises(RuntimeError):
+        converter.from_dict([1, 2])
+
+
+def test_validation_sampled_every():
+    converter = _broken_converter(Mapper(validation="sampled", sample_every=3))
+
+    converter.from_dict([1])
+    converter.from_dict([2])
+
+    with pytest.raises(RuntimeError):
+        converter.from_dict([3])
+
+
+def test_validation_sampled_rate():
+    with pytest.raises(RuntimeError):
+        _broken_converter(Mapper(validation="sampled", sample_rate=1.0)).from_dict([1])
+
+
+@pytest.mark.parametrize("validation", ["off", "sampled", "full"])
+@pytest.mark.parametrize("compiled", [False, True])
+def test_validation_modes_decode(validation, compiled):
+    mapper = Mapper(compiled=compiled, validation=validation, sample_every=1)
+    data = {"name": "a", "values": [1, "2"]}
+
+    assert mapper.from_dict(Item, data) == Item("a", [1, 2])
+    assert mapper.from_dicts(Item, [data]) == [Item("a", [1, 2])]
+
+
+def test_validation_pickle():
+    mapper = pickle.loads(pickle.dumps(Mapper(validation="sampled", sample_every=2)))
+
+    assert mapper.validation == "sampled"
+    assert mapper.from_dict(Item, {"name": "a"}) == Item("a")
+    assert mapper.should_sample() != mapper.should_sample()
+
+
+def test_invalid_validation_options():
+    with pytest.raises(RuntimeError):
+        Mapper(validation="always")
+
+    with pytest.raises(RuntimeError):
+        Mapper(validation="sampled", sample_every=2, sample_rate=0.5)
+
+    for options in ({"sample_every": 0}, {"sample_every": -1}, {"sample_rate": 0.0}, {"sample_rate": 1.5}):
+        with pytest.raises(RuntimeError):
+            Mapper(validation="sampled", **options)